@@ -12,8 +12,8 @@ from src.common.utils.date import parse_date
 from src.domain.entities.types import RepositoryTypes
 from src.domain.repositories.pull_requests import PullRequestsRepository
 from src.infra.monitoring.logger import MutedLogger
-from src.infra.repositories.azure.pull_requests import PullRequestsAzureRepository
-from src.infra.repositories.github.pull_requests import PullRequestsGithubRepository
+from src.infra.repositories.factory import get_repositories_for_git_repository
+from src.infra.requests.session import session_manager
 
 
 @dataclass
@@ -38,10 +38,11 @@ class CheckSettings(BaseController[None, None]):
 
             remote_repository: PullRequestsRepository
 
-            if repository.type == RepositoryTypes.AZURE:
-                remote_repository = PullRequestsAzureRepository(**options)
-            elif repository.type == RepositoryTypes.GITHUB:
-                remote_repository = PullRequestsGithubRepository(**options)  # type: ignore
+            if repository.type in [RepositoryTypes.AZURE, RepositoryTypes.GITHUB]:
+                RemotePullRequestRepository = get_repositories_for_git_repository(
+                    repository
+                )["pull_requests"]
+                remote_repository = RemotePullRequestRepository(**options)
             else:
                 self.logger.error(f"Repository type for {repository} is unknown")
                 error = True
@@ -62,6 +63,8 @@ class CheckSettings(BaseController[None, None]):
                 )
                 error = True
 
+        await session_manager.close()
+
         try:
             self.logger.info("Cloning repositories...")
             await CloneRepositoriesController(logger=MutedLogger()).execute()
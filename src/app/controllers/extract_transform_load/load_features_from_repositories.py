@@ -9,9 +9,11 @@ from src.common.monitoring.logger import LoggerInterface
 from src.common.settings import settings
 from src.common.utils.worker import concurrency_aio
 from src.domain.entities.feature import Feature
+from src.domain.entities.sync_state import SyncEntities
 from src.infra.repositories.git.features import FeaturesGit
 from src.infra.repositories.git.repositories import GitRepoLocal
 from src.infra.repositories.postgresql.features import FeaturesDatabaseRepository
+from src.infra.repositories.postgresql.sync_states import SyncStatesDatabaseRepository
 
 
 @dataclass
@@ -30,12 +32,13 @@ class LoadFeaturesController(BaseController[None, Sequence[Feature]]):
         db_features_repository = FeaturesDatabaseRepository(
             logger=self.logger, git_repository=repository
         )
+        sync_states_repository = SyncStatesDatabaseRepository(
+            logger=self.logger, git_repository=repository
+        )
         if not reload_all and max_date is None:
-            features_in_db = await db_features_repository.find_all()
-            # TODO Not optimized, implements optimized operations within repositories
-            for feature in features_in_db:
-                if max_date is None or feature.date > max_date:
-                    max_date = feature.date
+            max_date = await self.get_last_feature_date(
+                sync_states_repository, db_features_repository
+            )
 
         repo_path = f"{self.path}/{repository.name}"
         GitRepoLocal(logger=self.logger).checkout(
@@ -52,11 +55,34 @@ class LoadFeaturesController(BaseController[None, Sequence[Feature]]):
             }
         )
         await db_features_repository.upsert_all(features_from_git)
+        if features_from_git:
+            last_feature = max(features_from_git, key=lambda feature: feature.date)
+            await sync_states_repository.advance(
+                SyncEntities.FEATURES,
+                last_date=last_feature.date,
+                last_commit=last_feature.commit,
+            )
         self.logger.info(
             f"{len(features_from_git)} features from repository {repository.name} loaded..."
         )
         return features_from_git
 
+    async def get_last_feature_date(
+        self, sync_states_repository, db_features_repository
+    ):
+        sync_state = await sync_states_repository.get(SyncEntities.FEATURES)
+        if sync_state is not None:
+            return sync_state.last_date
+
+        # Features loaded before watermarks existed
+        last_feature = await db_features_repository.get_last_feature()
+        await sync_states_repository.advance(
+            SyncEntities.FEATURES,
+            last_date=last_feature.date if last_feature else None,
+            last_commit=last_feature.commit if last_feature else None,
+        )
+        return last_feature.date if last_feature else None
+
     @monitor("Loading features from repositories")
     async def execute(self, options=None) -> Sequence[Feature]:
         if not options:
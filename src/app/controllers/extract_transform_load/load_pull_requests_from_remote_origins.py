@@ -5,8 +5,10 @@ from src.app.controllers.base_controller import BaseController
 from src.app.utils.monitor import monitor
 from src.common.monitoring.logger import LoggerInterface
 from src.common.settings import settings
+from src.common.utils.date import parse_date
 from src.common.utils.worker import concurrency_aio
 from src.domain.entities.pull_request import PullRequest
+from src.domain.entities.sync_state import SyncEntities
 from src.domain.use_cases.transfer_pull_requests_from_repositories import (
     TransferPullRequestsToAnotherRepositoryUseCase,
 )
@@ -14,6 +16,8 @@ from src.infra.repositories.factory import get_repositories_for_git_repository
 from src.infra.repositories.postgresql.pull_requests import (
     PullRequestsDatabaseRepository,
 )
+from src.infra.repositories.postgresql.sync_states import SyncStatesDatabaseRepository
+from src.infra.requests.session import session_manager
 
 
 @dataclass
@@ -32,13 +36,24 @@ class LoadPullRequestsFromRemoteOriginController(
             logger=self.logger, git_repository=git_repository
         )
 
+        sync_states_repository = SyncStatesDatabaseRepository(
+            logger=self.logger, git_repository=git_repository
+        )
+
         # Only load new pull requests if there is no options
-        pull_requests = await target_repository.find_all()
-        if len(pull_requests) > 0 and options is None:
-            max_date = max(
-                pull_request.completion_date for pull_request in pull_requests
+        if options is None:
+            last_date = await self.get_last_completion_date(
+                sync_states_repository, target_repository
             )
-            options = {"start_date": max_date}
+            if last_date:
+                options = {"start_date": last_date}
+
+        # Pull requests unchanged since their last load are not fetched again
+        options = options or {}
+        known_versions = await target_repository.get_remote_versions(
+            parse_date(options.get("start_date"))
+        )
+        options = {**options, "known_versions": known_versions}
 
         usecase = TransferPullRequestsToAnotherRepositoryUseCase(
             logger=self.logger,
@@ -50,12 +65,35 @@ class LoadPullRequestsFromRemoteOriginController(
 
         pull_requests = await usecase.execute(options)
 
+        completion_dates = [
+            pull_request.completion_date for pull_request in pull_requests
+        ]
+        if completion_dates:
+            await sync_states_repository.advance(
+                SyncEntities.PULL_REQUESTS, last_date=max(completion_dates)
+            )
+
         return pull_requests
 
+    async def get_last_completion_date(self, sync_states_repository, target_repository):
+        sync_state = await sync_states_repository.get(SyncEntities.PULL_REQUESTS)
+        if sync_state is not None:
+            return sync_state.last_date
+
+        # Pull requests loaded before watermarks existed
+        last_date = await target_repository.get_last_completion_date()
+        await sync_states_repository.advance(
+            SyncEntities.PULL_REQUESTS, last_date=last_date
+        )
+        return last_date
+
     @monitor("Loading pull requests from remote origin")
     async def execute(self, options=None):
         branches = settings.get_branches()
 
         tasks = [(branch.repository, options) for branch in branches]
-        result = await self.load_from_repository.run_all(self, tasks)
+        try:
+            result = await self.load_from_repository.run_all(self, tasks)
+        finally:
+            await session_manager.close()
         return result
@@ -8,12 +8,14 @@ from src.app.controllers.extract_transform_load.load_pull_requests_from_remote_o
 from src.common.utils.date import parse_date
 from src.common.utils.worker import concurrency_aio
 from src.domain.entities.pull_request import PullRequest
+from src.domain.entities.sync_state import SyncEntities
 from src.domain.use_cases.transfer_pull_requests_from_repositories import (
     TransferPullRequestsToAnotherRepositoryUseCase,
 )
 from src.infra.repositories.postgresql.pull_requests import (
     PullRequestsDatabaseRepository,
 )
+from src.infra.repositories.postgresql.sync_states import SyncStatesDatabaseRepository
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -84,3 +86,36 @@ async def test_only_loads_new_pull_requests(
         mock_usecase.assert_any_call(
             {"start_date": parse_date(fixture_pull_request_dict["completion_date"])}
         )
+
+
+async def test_loads_pull_requests_from_sync_state(
+    mock_logger,
+    mock_git_settings,
+    fixture_pull_request_dict,
+):
+    git_repository = mock_git_settings.get_branches()[0].repository
+    sync_states_repository = SyncStatesDatabaseRepository(
+        logger=mock_logger, git_repository=git_repository
+    )
+    await sync_states_repository.advance(
+        SyncEntities.PULL_REQUESTS, last_date=parse_date("2021-10-25T11:10:13")
+    )
+
+    pull_request = PullRequest.from_dict(
+        {**fixture_pull_request_dict, "git_repository": git_repository}
+    )
+    with patch.object(
+        TransferPullRequestsToAnotherRepositoryUseCase,
+        'execute',
+        return_value=[pull_request],
+    ) as mock_usecase, patch.object(
+        PullRequestsDatabaseRepository, 'find_all'
+    ) as mock_find_all:
+        controller = LoadPullRequestsFromRemoteOriginController(logger=mock_logger)
+        await controller.execute()
+
+        mock_find_all.assert_not_called()
+        mock_usecase.assert_any_call({"start_date": parse_date("2021-10-25T11:10:13")})
+
+    sync_state = await sync_states_repository.get(SyncEntities.PULL_REQUESTS)
+    assert sync_state.last_date == pull_request.completion_date
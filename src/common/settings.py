@@ -28,6 +28,13 @@ class __Settings(BaseSettings):
 
     init_sql: str = os.getenv("INIT_SQL", "/indicators.sql")
 
+    github_api_url: str = os.getenv("GITHUB_API_URL", "https://api.github.com")
+
+    http_cache_path: str = os.getenv("HTTP_CACHE_PATH", "")
+    http_cache_max_size: int = os.getenv(  # type: ignore
+        "HTTP_CACHE_MAX_SIZE", 500 * 1024 * 1024
+    )
+
     def get_branches(self) -> list[Branch]:
         try:
             repositories_configuration = json.loads(self.git_branches)
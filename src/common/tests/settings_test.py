@@ -10,6 +10,7 @@ def test_get_branches_azure():
         "url": "git@ssh.dev.azure.com:v3/orga/project/Backend",
         "name": "Backend",
         "token": "azuretoken",
+        "api": None,
     }
 
     repository_2 = {
@@ -18,6 +19,7 @@ def test_get_branches_azure():
         "url": "git@ssh.dev.azure.com:v3/orga/project/WebApp",
         "name": "WebApp",
         "token": "azuretoken",
+        "api": None,
     }
 
     branch_1 = {
@@ -45,6 +47,7 @@ def test_get_branches_github():
         "url": "git@github.com:user/Backend.git",
         "name": "Backend",
         "token": "token",
+        "api": None,
     }
 
     repository_2 = {
@@ -53,6 +56,7 @@ def test_get_branches_github():
         "url": "git@github.com:user/WebApp.git",
         "name": "WebApp",
         "token": "token",
+        "api": "graphql",
     }
 
     branch_1 = {
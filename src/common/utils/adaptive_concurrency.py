@@ -0,0 +1,143 @@
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+from src.common.monitoring.logger import LoggerInterface
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Semaphore whose size follows an AIMD (additive increase, multiplicative
+    decrease) policy.
+
+    Each successful call raises the limit by `increase_step / concurrency`, that is
+    by about `increase_step` once every slot has succeeded. A throttling/server error, or
+    a p95 latency drifting above `latency_tolerance` times the best p95 observed,
+    multiplies the limit by `decrease_factor` (at most once per `cooldown` seconds,
+    so that a burst of errors counts as a single congestion signal).
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_concurrency: int = 1,
+        max_concurrency: int = 100,
+        increase_step: float = 1,
+        decrease_factor: float = 0.5,
+        latency_window: int = 50,
+        latency_tolerance: float = 2.0,
+        cooldown: float = 1.0,
+        name: str = "",
+        logger: Optional[LoggerInterface] = None,
+    ):
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(max(min_concurrency, min(initial, max_concurrency)))
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self.name = name
+        self.logger = logger
+
+        self.in_flight = 0
+        self.latencies: deque[float] = deque(maxlen=latency_window)
+        self.best_p95: Optional[float] = None
+        self.last_decrease = 0.0
+        self.waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return int(self.concurrency)
+
+    @property
+    def p95(self) -> Optional[float]:
+        if len(self.latencies) < self.latencies.maxlen:  # type: ignore
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[int(0.95 * (len(latencies) - 1))]
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "concurrency": self.limit,
+            "in_flight": self.in_flight,
+            "p95": self.p95,
+        }
+
+    async def acquire(self):
+        while self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self.waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # The slot this waiter may have been given goes to the next one
+                self.__wake_up_waiters()
+                raise
+            finally:
+                if waiter in self.waiters:
+                    self.waiters.remove(waiter)
+        self.in_flight += 1
+
+    def release(self):
+        self.in_flight -= 1
+        self.__wake_up_waiters()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *args):
+        self.release()
+
+    def record_success(self, latency: float):
+        self.latencies.append(latency)
+
+        p95 = self.p95
+        if p95 is not None:
+            if self.best_p95 is None or p95 < self.best_p95:
+                self.best_p95 = p95
+            elif p95 > self.best_p95 * self.latency_tolerance:
+                self.__decrease(f"p95 latency rose to {p95:.2f}s")
+                return
+
+        self.__set_concurrency(
+            self.concurrency + self.increase_step / max(self.concurrency, 1)
+        )
+
+    def record_failure(self, status: Optional[int] = None):
+        self.__decrease(f"status {status}" if status else "error")
+
+    def __decrease(self, reason: str):
+        now = time.monotonic()
+        if now - self.last_decrease < self.cooldown:
+            return
+
+        self.last_decrease = now
+        # Latencies measured at the previous concurrency are not relevant anymore
+        self.latencies.clear()
+        self.__set_concurrency(self.concurrency * self.decrease_factor, reason)
+
+    def __set_concurrency(self, concurrency: float, reason: str = ""):
+        previous_limit = self.limit
+        self.concurrency = max(
+            self.min_concurrency, min(concurrency, self.max_concurrency)
+        )
+
+        if self.limit != previous_limit:
+            if self.logger:
+                self.logger.info(
+                    f"Concurrency for {self.name}: {previous_limit} -> {self.limit}"
+                    + (f" ({reason})" if reason else "")
+                )
+            self.__wake_up_waiters()
+
+    def __wake_up_waiters(self):
+        available_slots = self.limit - self.in_flight
+        while available_slots > 0 and self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available_slots -= 1
@@ -21,6 +21,11 @@ class AsyncFilterIterator:
             except StopAsyncIteration:
                 raise StopAsyncIteration
 
+    async def aclose(self):
+        aclose = getattr(self.async_iterator, "aclose", None)
+        if aclose:
+            await aclose()
+
 
 class AsyncFilterEmptyIterator(AsyncFilterIterator):
     async def filter(self, value):
@@ -0,0 +1,54 @@
+import asyncio
+from typing import AsyncIterable, Optional
+
+_END = object()
+
+
+class AsyncPrefetchIterator:
+    """
+    Consumes `async_iterable` in a background task, `size` items ahead of the
+    reader: the producer and the reader of the items overlap, and the producer
+    waits when `size` items are not read yet.
+    """
+
+    def __init__(self, async_iterable: AsyncIterable, size: int = 1):
+        self.async_iterable = async_iterable
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.task: Optional[asyncio.Task] = None
+
+    async def produce(self):
+        try:
+            async for item in self.async_iterable:
+                await self.queue.put(item)
+        except asyncio.CancelledError:
+            # Runs the `finally` blocks of a source generator left suspended
+            aclose = getattr(self.async_iterable, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            raise
+        except Exception:
+            await self.queue.put(_END)
+            raise
+        await self.queue.put(_END)
+
+    def __aiter__(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self.produce())
+        return self
+
+    async def __anext__(self):
+        assert self.task is not None, "Iteration not started"
+        item = await self.queue.get()
+        if item is _END:
+            # Raises the exception of the producer, if any
+            await self.task
+            raise StopAsyncIteration
+        return item
+
+    async def aclose(self):
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
@@ -0,0 +1,69 @@
+import asyncio
+from unittest.mock import Mock
+
+from src.common.utils.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+
+def test_increases_concurrency_additively():
+    limiter = AdaptiveConcurrencyLimiter(initial=4, max_concurrency=10)
+
+    for _ in range(5):
+        limiter.record_success(0.1)
+
+    assert limiter.limit == 5
+
+
+def test_decreases_concurrency_multiplicatively_on_throttling():
+    logger = Mock()
+    limiter = AdaptiveConcurrencyLimiter(initial=20, name="host", logger=logger)
+
+    limiter.record_failure(429)
+    assert limiter.limit == 10
+    logger.info.assert_called_with("Concurrency for host: 20 -> 10 (status 429)")
+
+    # A burst of errors is a single congestion signal
+    limiter.record_failure(429)
+    assert limiter.limit == 10
+
+
+def test_decreases_concurrency_when_latency_rises():
+    limiter = AdaptiveConcurrencyLimiter(
+        initial=20, max_concurrency=20, latency_window=5
+    )
+
+    for _ in range(5):
+        limiter.record_success(0.1)
+    assert limiter.limit == 20
+
+    for _ in range(5):
+        limiter.record_success(1)
+    assert limiter.limit == 10
+
+
+def test_stays_within_bounds():
+    limiter = AdaptiveConcurrencyLimiter(
+        initial=2, min_concurrency=2, max_concurrency=3, cooldown=0
+    )
+
+    for _ in range(100):
+        limiter.record_success(0.1)
+    assert limiter.limit == 3
+
+    for _ in range(10):
+        limiter.record_failure(503)
+    assert limiter.limit == 2
+
+
+async def test_limits_requests_in_flight():
+    limiter = AdaptiveConcurrencyLimiter(initial=2)
+    in_flight = []
+
+    async def request():
+        async with limiter:
+            in_flight.append(limiter.in_flight)
+            await asyncio.sleep(0.05)
+
+    await asyncio.gather(*[request() for _ in range(6)])
+
+    assert max(in_flight) == 2
+    assert limiter.in_flight == 0
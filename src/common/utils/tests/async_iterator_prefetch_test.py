@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from src.common.utils.async_iterator_prefetch import AsyncPrefetchIterator
+
+
+async def test_iterates_over_all_items():
+    async def generator():
+        for i in range(5):
+            yield i
+
+    values = [v async for v in AsyncPrefetchIterator(generator(), size=2)]
+    assert values == [0, 1, 2, 3, 4]
+
+
+async def test_produces_items_ahead_of_the_reader():
+    produced = []
+
+    async def generator():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    iterator = AsyncPrefetchIterator(generator(), size=2).__aiter__()
+    assert await iterator.__anext__() == 0
+    await asyncio.sleep(0.01)
+
+    # One item read, two waiting in the queue and one waiting to be put
+    assert produced == [0, 1, 2, 3]
+
+    await iterator.aclose()
+
+
+async def test_raises_producer_exceptions():
+    async def generator():
+        yield 1
+        raise ValueError("error")
+
+    iterator = AsyncPrefetchIterator(generator())
+    with pytest.raises(ValueError):
+        async for _ in iterator:
+            pass
+
+
+async def test_closes_the_source_when_closed():
+    closed = []
+
+    async def generator():
+        try:
+            for i in range(10):
+                yield i
+        finally:
+            closed.append(True)
+
+    iterator = AsyncPrefetchIterator(generator()).__aiter__()
+    assert await iterator.__anext__() == 0
+    await iterator.aclose()
+
+    assert closed == [True]
@@ -1,9 +1,29 @@
 import asyncio
+import os
+import time
 from datetime import datetime
 
+import pytest
+
 from src.common.utils.worker import concurrency_aio
 
 
+@concurrency_aio(max_concurrency=2, executor="process")
+def get_process_id(msg):
+    return (msg, os.getpid())
+
+
+@concurrency_aio(max_concurrency=2, executor="process")
+async def async_get_process_id(msg):
+    return (msg, os.getpid())
+
+
+@concurrency_aio(max_concurrency=3, executor="thread")
+def blocking_fn(msg):
+    time.sleep(1)
+    return msg
+
+
 async def test_concurrency():
     await run_test(
         messages=["mes1", "mes2", "mes3"],
@@ -98,6 +118,107 @@ async def test_decorator_in_class_without_self():
     assert sorted(result) == ["msg1", "msg2"]
 
 
+async def test_stream_returns_all_results():
+    @concurrency_aio(max_concurrency=2)
+    async def fn(msg):
+        await asyncio.sleep(0.1)
+        return msg
+
+    result = [row async for row in fn.stream(["mes1", "mes2", "mes3"])]
+    assert sorted(result) == ["mes1", "mes2", "mes3"]
+
+
+async def test_stream_accepts_async_iterables():
+    @concurrency_aio(max_concurrency=2)
+    async def fn(msg, suffix):
+        return msg + suffix
+
+    async def messages():
+        for i in range(3):
+            yield (f"mes{i}", "-a")
+
+    result = [row async for row in fn.stream(messages())]
+    assert sorted(result) == ["mes0-a", "mes1-a", "mes2-a"]
+
+
+async def test_stream_does_not_pull_tasks_when_consumer_lags():
+    pulled_messages = []
+
+    def messages():
+        for i in range(100):
+            pulled_messages.append(i)
+            yield i
+
+    @concurrency_aio(max_concurrency=2, queue_size=3, buffer_size=4)
+    async def fn(msg):
+        return msg
+
+    iterator = fn.stream(messages())
+    async for _ in iterator:
+        break
+
+    await asyncio.sleep(0.2)
+
+    # 4 buffered results, 2 results waiting for room in buffer, 3 queued tasks,
+    # 1 task waiting for room in the queue and the one already consumed
+    assert len(pulled_messages) <= 11
+
+    await iterator.aclose()
+
+
+async def test_stream_raises_worker_exceptions():
+    @concurrency_aio(max_concurrency=2)
+    async def fn(msg):
+        if msg == "mes2":
+            raise ValueError("Cannot process mes2")
+        return msg
+
+    with pytest.raises(ValueError):
+        async for _ in fn.stream(["mes1", "mes2", "mes3"]):
+            pass
+
+
+async def test_stream_in_class():
+    class MyClass:
+        suffix = "-a"
+
+        @concurrency_aio(max_concurrency=2)
+        async def fn(self, msg):
+            return msg + self.suffix
+
+    cls = MyClass()
+
+    result = [row async for row in cls.fn.stream(cls, ["msg1", "msg2"])]
+    assert sorted(result) == ["msg1-a", "msg2-a"]
+
+
+async def test_process_executor():
+    result = await get_process_id.run_all(["mes1", "mes2", "mes3"])
+
+    assert sorted(msg for msg, _ in result) == ["mes1", "mes2", "mes3"]
+    assert all(pid != os.getpid() for _, pid in result)
+
+
+async def test_process_executor_with_async_function():
+    result = [row async for row in async_get_process_id.stream(["mes1", "mes2"])]
+
+    assert sorted(msg for msg, _ in result) == ["mes1", "mes2"]
+    assert all(pid != os.getpid() for _, pid in result)
+
+
+async def test_thread_executor_runs_blocking_functions_concurrently():
+    start = datetime.now()
+    result = await blocking_fn.run_all(["mes1", "mes2", "mes3"])
+
+    assert sorted(result) == ["mes1", "mes2", "mes3"]
+    assert (datetime.now() - start).total_seconds() < 2
+
+
+def test_unknown_executor():
+    with pytest.raises(ValueError):
+        concurrency_aio(max_concurrency=2, executor="gpu")
+
+
 def assert_concurrent(start_times, ref_difference=0.2):
     assert len(start_times) > 1, "Not enough messages to test concurrency"
     max_start_time = max(start_times)
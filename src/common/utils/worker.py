@@ -1,16 +1,42 @@
 import asyncio
 import inspect
 from abc import ABC, abstractmethod
-from typing import Any, Awaitable, Callable, Optional, Protocol, cast
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Iterable,
+    Optional,
+    Protocol,
+    cast,
+)
 
 from src.common.utils.async_iterator_filter import AsyncFilterEmptyIterator
 from src.common.utils.async_iterator_transformer import AsyncTransformIterator
 
+EXECUTORS: dict[str, Callable[..., Executor]] = {
+    "process": ProcessPoolExecutor,
+    "thread": ThreadPoolExecutor,
+}
+
+
+def run_sync(func: Callable[..., Any], *args: Any) -> Any:
+    result = func(*args)
+    if inspect.isawaitable(result):
+        return asyncio.run(result)  # type: ignore
+    return result
+
 
 class Worker(ABC):
-    def __init__(self, max_concurrency: Optional[int] = None):
+    def __init__(
+        self, max_concurrency: Optional[int] = None, executor: Optional[str] = None
+    ):
         self.semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
         self.max_concurrency = max_concurrency
+        self.executor = executor
+        self.pool: Optional[Executor] = None
 
     @abstractmethod
     async def process_task(self, task: Any, queue: asyncio.Queue) -> Any:
@@ -46,6 +72,20 @@ class Worker(ABC):
     async def work(self):
         return WorkerIterator(self)
 
+    async def run_in_executor(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func (sync or async) in the worker's process or thread pool."""
+        if self.pool is None:
+            assert self.executor is not None, "No executor configured"
+            self.pool = EXECUTORS[self.executor](max_workers=self.max_concurrency)
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.pool, run_sync, func, *args)
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
 
 class WorkerIterator:
     def __init__(self, worker: Worker):
@@ -64,23 +104,125 @@ class WorkerIterator:
     async def gather_results(self):
         await self.initialize_tasks()
 
-        while self.running_tasks:
-            done, _ = await asyncio.wait(
-                self.running_tasks, return_when=asyncio.FIRST_COMPLETED
-            )
-            for task in done:
-                was_stop_processing = self.stop_processing
+        try:
+            while self.running_tasks:
+                done, _ = await asyncio.wait(
+                    self.running_tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    was_stop_processing = self.stop_processing
+
+                    result, should_continue = await task
+                    self.running_tasks.remove(task)
+
+                    if not should_continue:
+                        self.stop_processing = True
+
+                    yield result
+
+                    if not was_stop_processing or not self.queue.empty():
+                        await self.worker.add_task(self.queue, self.running_tasks)
+        finally:
+            self.worker.shutdown()
+
+    def __aiter__(self):
+        self.result_iterator = self.gather_results()
+        return self
+
+    async def __anext__(self):
+        return await self.result_iterator.__anext__()
+
+
+class _Failure:
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+_STOP = object()
+
 
-                result, should_continue = await task
-                self.running_tasks.remove(task)
+class StreamingWorkerIterator:
+    """
+    Bounded alternative to WorkerIterator.
 
-                if not should_continue:
-                    self.stop_processing = True
+    Tasks are pulled lazily from `tasks` (an iterable or an async iterable) into a
+    queue holding at most `queue_size` items, and results wait in a buffer of at most
+    `buffer_size` items. When the consumer lags, workers block on the full buffer,
+    the queue fills up and the producer stops pulling tasks: memory stays flat
+    whatever the number of tasks.
+    """
+
+    def __init__(
+        self,
+        worker: Worker,
+        tasks: Iterable[Any] | AsyncIterable[Any],
+        queue_size: Optional[int] = None,
+        buffer_size: Optional[int] = None,
+    ):
+        self.worker = worker
+        self.tasks = tasks
+        self.concurrency = worker.max_concurrency or 1
+        self.queue: asyncio.Queue = asyncio.Queue(
+            maxsize=queue_size or self.concurrency
+        )
+        self.results: asyncio.Queue = asyncio.Queue(
+            maxsize=buffer_size or self.concurrency
+        )
+        self.running_tasks: list[asyncio.Task] = []
+
+    async def feed(self):
+        try:
+            if isinstance(self.tasks, AsyncIterable):
+                async for task in self.tasks:
+                    await self.queue.put(task)
+            else:
+                for task in self.tasks:
+                    await self.queue.put(task)
+        finally:
+            for _ in range(self.concurrency):
+                await self.queue.put(_STOP)
+
+    async def consume(self):
+        while True:
+            task = await self.queue.get()
+            if task is _STOP:
+                return
+
+            result, _ = await self.worker.process_task(task, self.queue)
+            await self.results.put(result)
+
+    async def close_when_done(self, tasks: list[asyncio.Task]):
+        try:
+            await asyncio.gather(*tasks)
+        except Exception as e:
+            await self.results.put(_Failure(e))
+        else:
+            await self.results.put(_STOP)
+
+    async def gather_results(self):
+        loop = asyncio.get_event_loop()
+        tasks = [loop.create_task(self.feed())] + [
+            loop.create_task(self.consume()) for _ in range(self.concurrency)
+        ]
+        self.running_tasks = tasks + [loop.create_task(self.close_when_done(tasks))]
+
+        try:
+            while True:
+                result = await self.results.get()
+                if result is _STOP:
+                    return
+                if isinstance(result, _Failure):
+                    raise result.exception
 
                 yield result
+        finally:
+            await self.aclose()
 
-                if not was_stop_processing or not self.queue.empty():
-                    await self.worker.add_task(self.queue, self.running_tasks)
+    async def aclose(self):
+        for task in self.running_tasks:
+            task.cancel()
+        self.running_tasks = []
+        self.worker.shutdown()
 
     def __aiter__(self):
         self.result_iterator = self.gather_results()
@@ -94,9 +236,31 @@ class ConcurrencyFunction(Protocol):
     def __call__(self, msg: Any) -> Any: ...
     def run(self, msgs: list[Any]) -> AsyncTransformIterator: ...
     def run_all(self, msgs: list[Any]) -> Awaitable[list[Any]]: ...
+    def stream(self, msgs: Iterable | AsyncIterable) -> AsyncTransformIterator: ...
+
+
+def concurrency_aio(
+    max_concurrency: int,
+    queue_size: Optional[int] = None,
+    buffer_size: Optional[int] = None,
+    executor: Optional[str] = None,
+):
+    """
+    `run` and `run_all` enqueue every task up front and `run_all` collects every
+    result. `stream` is the bounded variant: at most `queue_size` pending tasks and
+    `buffer_size` unconsumed results are held in memory (both default to
+    `max_concurrency`).
+
+    With `executor="process"` (or `"thread"`), tasks are sent to a pool of
+    `max_concurrency` processes (or threads) instead of running on the event loop.
+    The decorated function may then be sync or async; with processes, it must be
+    defined at module or class level and its arguments must be picklable.
+    """
+    if executor is not None and executor not in EXECUTORS:
+        raise ValueError(
+            f"Unknown executor {executor}, expected one of {list(EXECUTORS)}"
+        )
 
-
-def concurrency_aio(max_concurrency: int):
     def decorator(func: Callable[..., Any]):
         def get_parameters(parent_self, parameters):
             if parameters is None:
@@ -104,9 +268,7 @@ def concurrency_aio(max_concurrency: int):
                 parent_self = None
             return parent_self, parameters
 
-        def get_iterator(self, parameters=None):
-            parent_self, parameters = get_parameters(self, parameters)
-
+        def create_worker(parent_self):
             func_signature = inspect.signature(func)
             func_params = list(func_signature.parameters)
 
@@ -117,14 +279,21 @@ def concurrency_aio(max_concurrency: int):
                     else:
                         args = [task]
 
-                    if func_params[0] != "self":
-                        result = await func(*args)
+                    if func_params and func_params[0] == "self":
+                        args = [parent_self, *args]
+
+                    if executor:
+                        result = await self.run_in_executor(func, *args)
                     else:
-                        result = await func(parent_self, *args)
+                        result = await func(*args)
                     return (result, True)  # if result is None, it would stop iteration
 
-            worker = MyWorker(max_concurrency=max_concurrency)
-            worker_iterator = WorkerIterator(worker)
+            return MyWorker(max_concurrency=max_concurrency, executor=executor)
+
+        def get_iterator(self, parameters=None):
+            parent_self, parameters = get_parameters(self, parameters)
+
+            worker_iterator = WorkerIterator(create_worker(parent_self))
 
             for task in parameters:
                 worker_iterator.queue.put_nowait(task)
@@ -138,9 +307,20 @@ def concurrency_aio(max_concurrency: int):
             iterator = get_iterator(parent_self, parameters)
             return [result async for result in iterator]
 
+        def stream(self, parameters=None):
+            parent_self, parameters = get_parameters(self, parameters)
+            worker_iterator = StreamingWorkerIterator(
+                create_worker(parent_self),
+                parameters,
+                queue_size=queue_size,
+                buffer_size=buffer_size,
+            )
+            return AsyncFilterEmptyIterator(worker_iterator)
+
         decorated_func = cast(ConcurrencyFunction, func)
         setattr(decorated_func, 'run', get_iterator)
         setattr(decorated_func, 'run_all', run_all)
+        setattr(decorated_func, 'stream', stream)
 
         return decorated_func
 
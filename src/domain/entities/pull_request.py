@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Iterable
+from typing import Iterable, Optional
 
 from src.common.settings import settings
 from src.common.utils.date import format_to_iso, get_business_time_diff, parse_date
@@ -35,6 +35,10 @@ class PullRequest(BaseEntity):
 
     type: str
 
+    # Remote `updated_at` (or a digest of it), to detect pull requests changed
+    # since their last load
+    remote_version: Optional[str] = None
+
     @property
     def id(self):
         combined_string = f"{self.git_repository.path}.{self.source_id}"
@@ -131,6 +135,7 @@ class PullRequest(BaseEntity):
             target_branch=data.get("target_branch"),
             commit=data.get("commit"),
             previous_commit=data.get("previous_commit"),
+            remote_version=data.get("remote_version"),
         )
 
         pull_request.comments = [
@@ -13,6 +13,8 @@ class Repository(BaseEntity):
     url: str | None
     name: str
     token: str | None = None
+    # Remote API used to load pull requests (RepositoryApis), REST by default
+    api: str | None = None
 
     def __str__(self):
         return self.path
@@ -60,6 +62,7 @@ class Repository(BaseEntity):
             project=config.get("project"),
             name=config.get("name") or "",
             token=config.get("token"),
+            api=config.get("api"),
         )
 
     @classmethod
@@ -71,8 +74,10 @@ class Repository(BaseEntity):
             project = options["project"]
             name = options["name"]
             token = options["token"]
+            api = options.get("api")
         except Exception:
             token = None
+            api = None
             base_repo = config.split(":")[0]
             url = ":".join(config.split(":")[1:])
             parts = base_repo.split("/")
@@ -93,4 +98,5 @@ class Repository(BaseEntity):
             project=project,
             name=name,
             token=token,
+            api=api,
         )
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from src.common.utils.date import format_to_iso, parse_date
+from src.common.utils.json import recursive_asdict
+from src.common.utils.string import get_hash
+from src.domain.entities.common import BaseEntity
+from src.domain.entities.repository import Repository
+
+
+class SyncEntities:
+    PULL_REQUESTS = 'pull_requests'
+    FEATURES = 'features'
+
+
+@dataclass
+class SyncState(BaseEntity):
+    """Watermark of the last load of an entity from a repository."""
+
+    git_repository: Repository
+    entity: str
+    last_date: Optional[datetime] = None
+    last_commit: Optional[str] = None
+    last_etag: Optional[str] = None
+
+    @property
+    def id(self):
+        return get_hash(f"{self.git_repository.path}.{self.entity}")
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            git_repository=Repository.parse(data.get("git_repository")),
+            entity=data.get("entity"),
+            last_date=parse_date(data.get("last_date")),
+            last_commit=data.get("last_commit"),
+            last_etag=data.get("last_etag"),
+        )
+
+    def to_dict(self):
+        return {
+            **recursive_asdict(self),
+            "git_repository": self.git_repository.path,
+            "last_date": format_to_iso(self.last_date),
+        }
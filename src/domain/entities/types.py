@@ -3,4 +3,9 @@ class RepositoryTypes:
     GITHUB = 'github'
 
 
+class RepositoryApis:
+    REST = 'rest'
+    GRAPHQL = 'graphql'
+
+
 RepositoryType = str  # RepositoryTypes.AZURE | RepositoryTypes.GITHUB
@@ -1,4 +1,4 @@
-from typing import Optional, TypedDict
+from typing import AsyncIterator, Optional, TypedDict
 
 from src.common.monitoring.logger import LoggerInterface
 from src.common.repositories.base_repository import BaseRepository
@@ -10,6 +10,9 @@ class PullRequestsFilters(TypedDict):
     start_date: Optional[str]
     end_date: Optional[str]
     exclude_ids: Optional[list[str]]
+    # Remote version of the pull requests already loaded, by source id: the ones
+    # that did not change are not fetched again
+    known_versions: Optional[dict[str, str]]
 
 
 class PullRequestsRepository(BaseRepository[PullRequest, PullRequestsFilters, dict]):
@@ -21,3 +24,15 @@ class PullRequestsRepository(BaseRepository[PullRequest, PullRequestsFilters, di
     ):
         self.logger = logger
         self.git_repository = Repository.parse(git_repository)
+
+    async def find_all_in_batches(
+        self, filters: Optional[PullRequestsFilters] = None, batch_size: int = 100
+    ) -> AsyncIterator[list[PullRequest]]:
+        """
+        Yields the pull requests of `find_all` by batches of about `batch_size`.
+        Remote repositories override it to yield each batch as soon as its pages
+        are fetched and enriched.
+        """
+        pull_requests = await self.find_all(filters)
+        for i in range(0, len(pull_requests), batch_size):
+            yield pull_requests[i : i + batch_size]
@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Optional
+
+from src.common.monitoring.logger import LoggerInterface
+from src.common.repositories.base_repository import BaseRepository
+from src.domain.entities.repository import Repository
+from src.domain.entities.sync_state import SyncState
+
+
+class SyncStatesRepository(BaseRepository[SyncState, dict, dict]):
+    logger: LoggerInterface
+    git_repository: Repository
+
+    def __init__(
+        self, logger: LoggerInterface, git_repository: str | dict | Repository
+    ):
+        self.logger = logger
+        self.git_repository = Repository.parse(git_repository)
+
+    async def get(self, entity: str) -> Optional[SyncState]:
+        raise NotImplementedError()
+
+    async def advance(
+        self,
+        entity: str,
+        last_date: Optional[datetime] = None,
+        last_commit: Optional[str] = None,
+        last_etag: Optional[str] = None,
+    ) -> None:
+        """Moves the watermark of entity forward, never backward."""
+        raise NotImplementedError()
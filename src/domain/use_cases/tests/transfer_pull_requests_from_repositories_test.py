@@ -136,3 +136,37 @@ async def test_create_or_updates_comments_for_pull_requests_that_exist_yet(
     updated_pull_requests = await target_repository.find_all()
     assert len(updated_pull_requests) == 1
     assert len(updated_pull_requests[0].comments) == 2
+
+
+async def test_upserts_pull_requests_by_batches(
+    init_use_case, fixture_pull_request_dict
+):
+    (
+        use_case,
+        source_repository,
+        target_repository,
+    ) = init_use_case
+    use_case.batch_size = 2
+
+    source_pull_requests = [
+        PullRequest.from_dict(
+            {**fixture_pull_request_dict, "source_id": str(i), "comments": []}
+        )
+        for i in range(5)
+    ]
+    await source_repository.upsert_all(source_pull_requests)
+
+    batch_sizes = []
+    upsert_all = target_repository.upsert_all
+
+    async def upsert_batch(entities, options=None):
+        batch_sizes.append(len(entities))
+        await upsert_all(entities, options)
+
+    target_repository.upsert_all = upsert_batch  # type: ignore
+
+    pull_requests = await use_case.execute()
+
+    assert batch_sizes == [2, 2, 1]
+    assert len(pull_requests) == 5
+    assert len(await target_repository.find_all()) == 5
@@ -3,6 +3,7 @@ from typing import Optional
 
 from src.common.monitoring.logger import LoggerInterface
 from src.common.use_cases.base_use_case import BaseUseCaseWithParameters
+from src.common.utils.async_iterator_prefetch import AsyncPrefetchIterator
 from src.domain.entities.pull_request import PullRequest
 from src.domain.repositories.pull_requests import (
     PullRequestsFilters,
@@ -19,6 +20,11 @@ class TransferPullRequestsToAnotherRepositoryUseCase(
 
     logger: LoggerInterface
 
+    # Pull requests upserted per transaction
+    batch_size: int = 100
+    # Batches fetched from the source while the previous ones are upserted
+    queue_size: int = 2
+
     async def execute(
         self,
         options: Optional[PullRequestsFilters] = None,
@@ -29,13 +35,25 @@ class TransferPullRequestsToAnotherRepositoryUseCase(
             f"Getting pull requests from {self.source_repository.__class__.__name__}..."
         )
 
-        pull_requests_from_source = await self.source_repository.find_all(
-            options_filters
-        )
-
-        await self.target_repository.upsert_all(
-            pull_requests_from_source,
-            {"upsert_comments": True, "upsert_developers": True},
+        # Source and target run concurrently: batches are upserted while the next
+        # ones are fetched, and at most `queue_size` batches wait in memory
+        batches = AsyncPrefetchIterator(
+            self.source_repository.find_all_in_batches(
+                options_filters, self.batch_size
+            ),
+            self.queue_size,
         )
 
-        return pull_requests_from_source
+        pull_requests: list[PullRequest] = []
+        try:
+            async for batch in batches:
+                await self.target_repository.upsert_all(
+                    batch,
+                    {"upsert_comments": True, "upsert_developers": True},
+                )
+                pull_requests += batch
+                self.logger.info(f"{len(pull_requests)} pull requests saved")
+        finally:
+            await batches.aclose()
+
+        return pull_requests
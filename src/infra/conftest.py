@@ -1,8 +1,16 @@
 import pytest
 from aioresponses import aioresponses
 
+from src.infra.requests.session import session_manager
+
 
 @pytest.fixture
 def mocker_aio():
     with aioresponses() as mocker:
         yield mocker
+
+
+@pytest.fixture(autouse=True)
+async def close_session():
+    yield
+    await session_manager.close()
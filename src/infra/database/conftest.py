@@ -57,6 +57,10 @@ async def create_test_schema(mocker, db_schema, mock_git_settings, mock_get_db_s
         "src.infra.repositories.postgresql.features.FeaturesDatabaseRepository.Model",
         new=model_load["Feature"],
     )
+    mocker.patch(
+        "src.infra.repositories.postgresql.sync_states.SyncStatesDatabaseRepository.Model",
+        new=model_load["SyncState"],
+    )
 
     async with get_db_session() as session:
         await session.execute(text(f"CREATE SCHEMA {schema_name}"))
@@ -9,7 +9,7 @@ from sqlalchemy_utils import create_database, database_exists, drop_database
 from src.common.settings import settings
 from src.infra.database.postgresql.models.factory import build_models
 
-from .models.models import Comment, Developer, Feature, PullRequest
+from .models.models import Comment, Developer, Feature, PullRequest, SyncState
 
 __engine = None
 AsyncSessionLocal = None
@@ -110,7 +110,7 @@ async def init_db(schema=None):
 async def empty_db():
     async with get_db_session() as session:
         async with session.begin():
-            for model in [Feature, Comment, PullRequest, Developer]:
+            for model in [SyncState, Feature, Comment, PullRequest, Developer]:
                 try:
                     await session.execute(delete(model))
                 except Exception:
@@ -23,6 +23,7 @@ from src.domain.entities.developer import Developer as DeveloperEntity
 from src.domain.entities.feature import Feature as FeatureEntity
 from src.domain.entities.pull_request import PullRequest as PullRequestEntity
 from src.domain.entities.repository import Repository
+from src.domain.entities.sync_state import SyncState as SyncStateEntity
 
 
 def build_models(schema):
@@ -160,6 +161,8 @@ def build_models(schema):
         title = Column(String)
         type = Column(String)
 
+        remote_version = Column(String)
+
         created_by = relationship("Developer", back_populates="pull_requests")
 
         @staticmethod
@@ -175,6 +178,7 @@ def build_models(schema):
                 target_branch=data.target_branch,
                 previous_commit=data.previous_commit,
                 commit=data.commit,
+                remote_version=data.remote_version,
                 created_by=Developer.to_entity(data.created_by),
                 approvers=(
                     [Developer.to_entity(approver) for approver in data.approvers]
@@ -209,6 +213,7 @@ def build_models(schema):
                 "previous_commit": pull_request.previous_commit,
                 "commit": pull_request.commit,
                 "created_by_id": pull_request.created_by.email,
+                "remote_version": pull_request.remote_version,
             }
 
             if many_to_many:
@@ -280,6 +285,43 @@ def build_models(schema):
         def __repr__(self):
             return f"<Feature(id={self.id}, commit={self.commit}, repository={self.repository.path})>"
 
+    class SyncState(BaseModel):
+        __tablename__ = "sync_state"
+
+        id = Column(String, primary_key=True)
+
+        repository = Column(String, nullable=False)
+        entity = Column(String, nullable=False)
+
+        last_date = Column(DateTime(timezone=True))
+        last_commit = Column(String)
+        last_etag = Column(String)
+
+        @staticmethod
+        def from_entity(entity: BaseEntity, options=None):
+            sync_state = cast(SyncStateEntity, entity)
+            return {
+                "id": sync_state.id,
+                "repository": sync_state.git_repository.path,
+                "entity": sync_state.entity,
+                "last_date": sync_state.last_date,
+                "last_commit": sync_state.last_commit,
+                "last_etag": sync_state.last_etag,
+            }
+
+        @staticmethod
+        def to_entity(data):
+            return SyncStateEntity(
+                git_repository=Repository.parse(data.repository),
+                entity=data.entity,
+                last_date=data.last_date,
+                last_commit=data.last_commit,
+                last_etag=data.last_etag,
+            )
+
+        def __repr__(self):
+            return f"<SyncState(repository={self.repository}, entity={self.entity})>"
+
     models = weakref.WeakValueDictionary(
         {
             "BaseModel": BaseModel,
@@ -288,6 +330,7 @@ def build_models(schema):
             "Feature": Feature,
             "Comment": Comment,
             "PullRequest": PullRequest,
+            "SyncState": SyncState,
             "pull_request_approvers": pull_request_approvers,
         }
     )
@@ -9,4 +9,5 @@ Developer = models["Developer"]
 Feature = models["Feature"]
 Comment = models["Comment"]
 PullRequest = models["PullRequest"]
+SyncState = models["SyncState"]
 pull_request_approvers = models["pull_request_approvers"]
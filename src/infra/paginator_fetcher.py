@@ -1,9 +1,12 @@
 import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Tuple
+from typing import Any, AsyncIterator, Mapping, Optional, Tuple
+from urllib.parse import urlparse
 
 import aiohttp
 
+from src.common.utils.adaptive_concurrency import AdaptiveConcurrencyLimiter
 from src.common.utils.async_iterator_filter import AsyncFilterEmptyIterator
 from src.common.utils.worker import Worker
 from src.infra.requests.fetch import async_fetch
@@ -13,6 +16,37 @@ class RequestException(Exception):
     pass
 
 
+THROTTLING_STATUS_CODES = [403, 429]
+
+DEFAULT_ADAPTIVE_CONCURRENCY = {
+    "initial": 20,
+    "min_concurrency": 1,
+    "max_concurrency": 150,
+}
+
+# Shared by all paginators: the number of requests in flight is adapted per host
+concurrency_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_concurrency_limiter(
+    url: str, logger, options: Optional[dict[str, Any]] = None
+) -> AdaptiveConcurrencyLimiter:
+    host = urlparse(url).netloc
+    limiter = concurrency_limiters.get(host)
+    if limiter is None:
+        limiter = AdaptiveConcurrencyLimiter(
+            **{**DEFAULT_ADAPTIVE_CONCURRENCY, **(options or {})},
+            name=host,
+            logger=logger,
+        )
+        concurrency_limiters[host] = limiter
+    return limiter
+
+
+def is_congestion_error(status: int) -> bool:
+    return status in THROTTLING_STATUS_CODES or status >= 500
+
+
 class PaginatorWorker(Worker, ABC):
     def __init__(
         self,
@@ -22,6 +56,8 @@ class PaginatorWorker(Worker, ABC):
         max_concurrency: int = 10,
         timeout: Optional[int] = None,
         non_blocking_error_codes=None,
+        adaptive_concurrency: Optional[dict[str, Any]] = None,
+        fan_out: bool = False,
     ):
         super().__init__(max_concurrency)
         assert max_concurrency is not None, "max_concurrency is mandatory"
@@ -32,11 +68,21 @@ class PaginatorWorker(Worker, ABC):
         self.page = 0
         self.page_lock = asyncio.Lock()
         self.non_blocking_error_codes = non_blocking_error_codes or []
+        self.adaptive_concurrency = adaptive_concurrency
+        self.fan_out = fan_out
 
     @abstractmethod
     async def get_url(self, page: int) -> str:
         pass
 
+    def get_page_count(self, headers: Mapping[str, str]) -> Optional[int]:
+        """Total number of pages, when the first response tells it."""
+        return None
+
+    def get_next_url(self, url: str, headers: Mapping[str, str]) -> Optional[str]:
+        """URL of the next page, when the response gives one (continuation token)."""
+        return None
+
     async def process_data(
         self, data: Any, options: Optional[dict[str, Any]] = None
     ) -> Tuple[Any, bool]:
@@ -46,18 +92,39 @@ class PaginatorWorker(Worker, ABC):
         self, url: str, options: Optional[dict[str, Any]] = None
     ) -> Tuple[Any, bool]:
         """Fetch data from the given URL and process it."""
+        data, _ = await self.request(url)
+        return await self.process_data(data, options)
+
+    async def request(self, url: str) -> Tuple[Any, Mapping[str, str]]:
         self.logger.info(f"Fetching {url}")
 
+        limiter = get_concurrency_limiter(url, self.logger, self.adaptive_concurrency)
         try:
-            data = await async_fetch(url, headers=self.headers, timeout=self.timeout)
+            async with limiter:
+                start_time = time.monotonic()
+                try:
+                    data, headers = await async_fetch(
+                        url,
+                        headers=self.headers,
+                        timeout=self.timeout,
+                        return_headers=True,
+                    )
+                except aiohttp.ClientResponseError as e:
+                    if is_congestion_error(e.status):
+                        limiter.record_failure(e.status)
+                    raise e
+                except asyncio.TimeoutError as e:
+                    limiter.record_failure()
+                    raise e
+                limiter.record_success(time.monotonic() - start_time)
         except aiohttp.ClientResponseError as e:
             if e.status in self.non_blocking_error_codes:
                 self.logger.info(f"Non blocking error for {url}")
-                data = []
+                data, headers = [], {}
             else:
                 raise e
 
-        return await self.process_data(data, options)
+        return data, headers
 
     async def add_url_to_queue(
         self, queue: asyncio.Queue, options: Optional[dict[str, Any]] = None
@@ -75,8 +142,83 @@ class PaginatorWorker(Worker, ABC):
         return data, should_continue
 
     async def fetch(self, options: Optional[dict[str, Any]] = None):
+        if self.fan_out:
+            return AsyncFilterEmptyIterator(self.fetch_fan_out(options))
+
         iterator = await self.work()
         for _ in range(self.max_concurrency):  # type: ignore
             await self.add_url_to_queue(iterator.queue, options)
 
         return AsyncFilterEmptyIterator(iterator)
+
+    async def fetch_fan_out(
+        self, options: Optional[dict[str, Any]] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Fetch the first page, then fan out the next ones in parallel.
+
+        When the first response gives the page count (Github `Link` header), exactly
+        the remaining pages are requested. Otherwise pages are requested ahead,
+        `max_concurrency` at a time, until one of them says it is the last one: the
+        requests in flight for pages after it are then cancelled.
+
+        When responses give the URL of the next page instead (continuation token),
+        pages are followed one after the other.
+        """
+        url = await self.get_url(0)
+        data, headers = await self.request(url)
+        page_count = self.get_page_count(headers)
+        next_url = self.get_next_url(url, headers)
+        data, should_continue = await self.process_data(data, options)
+        yield data
+
+        if next_url is not None:
+            while should_continue and next_url is not None:
+                url = next_url
+                data, headers = await self.request(url)
+                next_url = self.get_next_url(url, headers)
+                data, should_continue = await self.process_data(data, options)
+                yield data
+            return
+
+        if not should_continue:
+            return
+
+        end = page_count
+        next_page = 1
+        running: dict[asyncio.Task, int] = {}
+        cancelled: list[asyncio.Task] = []
+        try:
+            while True:
+                while len(running) < self.max_concurrency and (  # type: ignore
+                    end is None or next_page < end
+                ):
+                    url = await self.get_url(next_page)
+                    task = asyncio.create_task(self.fetch_data(url, options))
+                    running[task] = next_page
+                    next_page += 1
+
+                if not running:
+                    return
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=lambda task: running[task]):
+                    page = running.pop(task)
+                    if end is not None and page >= end:
+                        continue
+
+                    data, should_continue = task.result()
+                    if not should_continue:
+                        end = page + 1
+                        for other_task, other_page in list(running.items()):
+                            if other_page >= end:
+                                other_task.cancel()
+                                cancelled.append(other_task)
+                                del running[other_task]
+                    yield data
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, *cancelled, return_exceptions=True)
@@ -1,7 +1,5 @@
 import itertools
 
-import aiohttp
-
 from src.common.utils.worker import concurrency_aio
 from src.domain.entities.comment import Comment
 from src.domain.repositories.comments import CommentsRepository
@@ -19,10 +17,7 @@ class CommentsAzureRepository(CommentsRepository):
         url = f"{get_base_url(self.git_repository)}/pullRequests/{pull_request_source_id}/threads"
 
         self.logger.info(f"Getting comments for {pull_request_source_id}")
-        data = await async_fetch(
-            url,
-            client=self.client,
-        )
+        data = await async_fetch(url, headers=get_header(self.git_repository))
 
         authors_to_exclude = filters.get("authors_to_exclude", [])
         comments = []
@@ -54,12 +49,8 @@ class CommentsAzureRepository(CommentsRepository):
     async def find_all(self, filters=None):
         pull_requests_ids = self._get_pull_requests_from_options(filters)
 
-        async with aiohttp.ClientSession(
-            headers=get_header(self.git_repository),
-        ) as client:
-            self.client = client
-            result = await self.__fetch_comments_for_pull_requests.run_all(
-                self, [(ids, filters) for ids in pull_requests_ids]
-            )
+        result = await self.__fetch_comments_for_pull_requests.run_all(
+            self, [(ids, filters) for ids in pull_requests_ids]
+        )
 
         return list(itertools.chain.from_iterable(result))
@@ -1,6 +1,10 @@
+import json
 from collections import defaultdict
+from urllib.parse import quote
 
-from src.common.utils.date import is_in_range, parse_date
+from src.common.utils.async_iterator_prefetch import AsyncPrefetchIterator
+from src.common.utils.date import date_to_iso, is_in_range, parse_date
+from src.common.utils.string import get_hash
 from src.domain.entities.pull_request import PullRequest
 from src.domain.repositories.pull_requests import PullRequestsRepository
 from src.infra.paginator_fetcher import PaginatorWorker
@@ -15,10 +19,11 @@ class PullRequestsAzureRepository(PullRequestsRepository):
         self.pagination = {
             "max_concurrency": 3,
             "items_per_page": 1000,
+            "fan_out": True,
             **pagination,
         }
 
-    async def __get_pull_requests_from_azure(self, start_date, end_date):
+    async def __get_pages_from_azure(self, start_date, end_date):
         worker = PullRequestPaginatorWorker(
             start_date=start_date,
             end_date=end_date,
@@ -28,57 +33,74 @@ class PullRequestsAzureRepository(PullRequestsRepository):
             **self.pagination,
         )
 
-        pull_requests: list[dict] = []
-        iterator = await worker.fetch()
-        async for row in iterator:
-            pull_requests = pull_requests + row
+        # Next pages are fetched while the current batch is enriched
+        pages = AsyncPrefetchIterator(await worker.fetch())
+        try:
+            async for rows in pages:
+                yield rows
+        finally:
+            await pages.aclose()
 
-        return pull_requests
+    async def __complete(self, pull_requests: list[PullRequest]):
+        comments_by_pull_requests = defaultdict(list)
 
-    async def find_all(self, filters=None):
+        comments_repo = CommentsAzureRepository(
+            logger=self.logger, git_repository=self.git_repository
+        )
+        comments = await comments_repo.find_all({"pull_requests": pull_requests})
+        for comment in comments:
+            comments_by_pull_requests[comment.pull_request_id].append(comment)
+
+        for pull_request in pull_requests:
+            pull_request.comments = comments_by_pull_requests[pull_request.id]
+
+    async def find_all_in_batches(self, filters=None, batch_size=100):
         filters = filters or {}
 
         get_comments = filters.get("get_comments", True)
         start_date = parse_date(filters.get("start_date"))
         end_date = parse_date(filters.get("end_date"))
         exclude_ids = set([str(id) for id in filters.get("exclude_ids", [])])
+        known_versions = filters.get("known_versions") or {}
 
         self.logger.info(
             f"Fetching pull requests in {self.git_repository} Azure from {start_date} to {end_date}"
         )
 
-        pull_requests_from_azure = await self.__get_pull_requests_from_azure(
-            start_date, end_date
-        )
-
         pull_requests: list[PullRequest] = []
-        for pr in pull_requests_from_azure:
-            source_id = str(pr["source_id"])
-            if source_id in exclude_ids:
-                continue
-
-            is_merged = pr["is_merged"]
-            if not is_merged:
-                continue
-
-            pull_request = PullRequest.from_dict(
-                {"git_repository": self.git_repository, **pr}
-            )
-            pull_requests.append(pull_request)
-
-        if get_comments and pull_requests:
-            comments_by_pull_requests = defaultdict(list)
-
-            comments_repo = CommentsAzureRepository(
-                logger=self.logger, git_repository=self.git_repository
-            )
-            comments = await comments_repo.find_all({"pull_requests": pull_requests})
-            for comment in comments:
-                comments_by_pull_requests[comment.pull_request_id].append(comment)
-
-            for pull_request in pull_requests:
-                pull_request.comments = comments_by_pull_requests[pull_request.id]
+        async for rows in self.__get_pages_from_azure(start_date, end_date):
+            for pr in rows:
+                source_id = str(pr["source_id"])
+                if source_id in exclude_ids:
+                    continue
+                if known_versions.get(source_id) == pr["remote_version"]:
+                    # Unchanged since its last load: comments too
+                    continue
+
+                is_merged = pr["is_merged"]
+                if not is_merged:
+                    continue
+
+                pull_request = PullRequest.from_dict(
+                    {"git_repository": self.git_repository, **pr}
+                )
+                pull_requests.append(pull_request)
+
+            if len(pull_requests) >= batch_size:
+                if get_comments:
+                    await self.__complete(pull_requests)
+                yield pull_requests
+                pull_requests = []
+
+        if pull_requests:
+            if get_comments:
+                await self.__complete(pull_requests)
+            yield pull_requests
 
+    async def find_all(self, filters=None):
+        pull_requests: list[PullRequest] = []
+        async for batch in self.find_all_in_batches(filters):
+            pull_requests += batch
         return pull_requests
 
 
@@ -89,9 +111,26 @@ class PullRequestPaginatorWorker(PaginatorWorker):
         self.end_date = kwargs.pop("end_date")
         super().__init__(*args, **kwargs)
 
+    def get_search_url(self) -> str:
+        url = f"{get_base_url(self.git_repository)}/pullRequests?searchCriteria.status=all"
+        if self.start_date or self.end_date:
+            # Azure only returns the pull requests created in the window
+            url += "&searchCriteria.queryTimeRangeType=created"
+        if self.start_date:
+            url += f"&searchCriteria.minTime={date_to_iso(self.start_date)}"
+        if self.end_date:
+            url += f"&searchCriteria.maxTime={date_to_iso(self.end_date)}"
+        return f"{url}&$top={self.items_per_page}"
+
     async def get_url(self, page: int) -> str:
         skip = page * self.items_per_page
-        return f"{get_base_url(self.git_repository)}/pullRequests?searchCriteria.status=all&$top={self.items_per_page}&$skip={skip}"
+        return f"{self.get_search_url()}&$skip={skip}"
+
+    def get_next_url(self, url, headers):
+        continuation_token = headers.get("x-ms-continuationtoken")
+        if not continuation_token:
+            return None
+        return f"{self.get_search_url()}&continuationToken={quote(continuation_token)}"
 
     async def process_data(self, data, options=None):
         rows = data["value"]
@@ -151,7 +190,27 @@ class PullRequestPaginatorWorker(PaginatorWorker):
                     "previous_commit": (
                         previous_commit["commitId"] if previous_commit else None
                     ),
+                    "remote_version": get_remote_version(row),
                 }
             )
 
-        return transformed_rows, len(transformed_rows) == self.items_per_page
+        return transformed_rows, len(rows) == self.items_per_page
+
+
+def get_remote_version(row) -> str:
+    # Azure does not give the last update date of a pull request: its version is a
+    # digest of the fields that change with it (comment threads are not listed)
+    return get_hash(
+        json.dumps(
+            [
+                row["status"],
+                row.get("closedDate"),
+                row["title"],
+                (row.get("lastMergeCommit") or {}).get("commitId"),
+                sorted(
+                    [reviewer["uniqueName"], reviewer["vote"]]
+                    for reviewer in row["reviewers"]
+                ),
+            ]
+        )
+    )
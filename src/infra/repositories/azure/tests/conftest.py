@@ -16,12 +16,33 @@ def mock_thread_comments(mocker_aio):
 
 @pytest.fixture
 def mock_api_pull_requests(mocker_aio):
-    def mock(pull_requests, per_page=1000, page=1):
+    def mock(
+        pull_requests,
+        per_page=1000,
+        page=1,
+        start_date=None,
+        end_date=None,
+        continuation_token=None,
+        headers=None,
+    ):
         top = per_page
         skip = (page - 1) * per_page
+        search = ""
+        if start_date or end_date:
+            search += "&searchCriteria.queryTimeRangeType=created"
+        if start_date:
+            search += f"&searchCriteria.minTime={start_date}"
+        if end_date:
+            search += f"&searchCriteria.maxTime={end_date}"
+        paging = (
+            f"continuationToken={continuation_token}"
+            if continuation_token
+            else f"$skip={skip}"
+        )
         mocker_aio.get(
-            f"https://dev.azure.com/orga/testproject/_apis/git/repositories/myrepo/pullRequests?searchCriteria.status=all&$top={top}&$skip={skip}",
+            f"https://dev.azure.com/orga/testproject/_apis/git/repositories/myrepo/pullRequests?searchCriteria.status=all{search}&$top={top}&{paging}",
             payload={"value": pull_requests},
+            headers=headers,
         )
 
     return mock
@@ -123,7 +123,13 @@ async def test_does_use_pagination(
 async def test_stops_using_pagination_with_dates(
     mock_completed_pull_request_in_azure, repository_concurrency, mock_api_pull_requests
 ):
-    mock_api_pull_requests([mock_completed_pull_request_in_azure], per_page=1, page=1)
+    mock_api_pull_requests(
+        [mock_completed_pull_request_in_azure],
+        per_page=1,
+        page=1,
+        end_date="2023-10-15T00:00:00Z",
+    )
+    mock_api_pull_requests([], per_page=1, page=2, end_date="2023-10-15T00:00:00Z")
 
     pull_requests = await repository_concurrency.find_all(
         {
@@ -133,10 +139,39 @@ async def test_stops_using_pagination_with_dates(
     assert len(pull_requests) == 0
 
 
+async def test_follows_continuation_tokens(
+    mock_completed_pull_request_in_azure,
+    mock_completed_pull_request_2_in_azure,
+    repository_concurrency,
+    mock_thread_comments,
+    mock_api_pull_requests,
+):
+    mock_api_pull_requests(
+        [mock_completed_pull_request_in_azure],
+        per_page=1,
+        page=1,
+        headers={"x-ms-continuationtoken": "token2"},
+    )
+    mock_api_pull_requests(
+        [mock_completed_pull_request_2_in_azure],
+        per_page=1,
+        continuation_token="token2",
+        headers={"x-ms-continuationtoken": "token3"},
+    )
+    mock_api_pull_requests([], per_page=1, continuation_token="token3")
+    mock_thread_comments(mock_completed_pull_request_in_azure["pullRequestId"], [])
+    mock_thread_comments(mock_completed_pull_request_2_in_azure["pullRequestId"], [])
+
+    pull_requests = await repository_concurrency.find_all()
+    assert len(pull_requests) == 2
+
+
 async def test_filters_out_pull_requests_with_date_before_start_date(
     mock_completed_pull_request_in_azure, repository, mock_api_pull_requests
 ):
-    mock_api_pull_requests([mock_completed_pull_request_in_azure])
+    mock_api_pull_requests(
+        [mock_completed_pull_request_in_azure], start_date="2024-10-15T00:00:00Z"
+    )
 
     pull_requests = await repository.find_all(
         {
@@ -149,7 +184,9 @@ async def test_filters_out_pull_requests_with_date_before_start_date(
 async def test_filters_out_pull_requests_with_date_after_end_date(
     mock_completed_pull_request_in_azure, repository, mock_api_pull_requests
 ):
-    mock_api_pull_requests([mock_completed_pull_request_in_azure])
+    mock_api_pull_requests(
+        [mock_completed_pull_request_in_azure], end_date="2020-10-15T00:00:00Z"
+    )
 
     pull_requests = await repository.find_all(
         {
@@ -165,7 +202,11 @@ async def test_filters_in_pull_requests_with_startdate_and_enddate(
     mock_thread_comments,
     mock_api_pull_requests,
 ):
-    mock_api_pull_requests([mock_completed_pull_request_in_azure])
+    mock_api_pull_requests(
+        [mock_completed_pull_request_in_azure],
+        start_date="2020-10-15T00:00:00Z",
+        end_date="2025-10-15T00:00:00Z",
+    )
 
     mock_thread_comments(
         mock_completed_pull_request_in_azure["pullRequestId"],
@@ -1,9 +1,12 @@
 from src.domain.entities.repository import Repository
-from src.domain.entities.types import RepositoryTypes
+from src.domain.entities.types import RepositoryApis, RepositoryTypes
 from src.infra.repositories.azure.comments import CommentsAzureRepository
 from src.infra.repositories.azure.pull_requests import PullRequestsAzureRepository
 from src.infra.repositories.github.comments import CommentsGithubRepository
 from src.infra.repositories.github.pull_requests import PullRequestsGithubRepository
+from src.infra.repositories.github.pull_requests_graphql import (
+    PullRequestsGithubGraphqlRepository,
+)
 
 
 def get_repositories_for_git_repository(
@@ -12,7 +15,11 @@ def get_repositories_for_git_repository(
     type = git_repository.type
     if type == RepositoryTypes.GITHUB:
         RemoteCommentRepository = CommentsGithubRepository  # type: ignore
-        RemotePullRequestRepository = PullRequestsGithubRepository  # type: ignore
+        RemotePullRequestRepository = (
+            PullRequestsGithubGraphqlRepository  # type: ignore
+            if git_repository.api == RepositoryApis.GRAPHQL
+            else PullRequestsGithubRepository
+        )
     elif type == RepositoryTypes.AZURE:
         RemoteCommentRepository = CommentsAzureRepository  # type: ignore
         RemotePullRequestRepository = PullRequestsAzureRepository  # type: ignore
@@ -1,3 +1,4 @@
+import itertools
 import re
 from dataclasses import dataclass
 
@@ -5,6 +6,7 @@ from pydriller import Git, Repository  # type: ignore
 
 from src.common.monitoring.logger import LoggerInterface
 from src.common.utils.date import format_to_utc, parse_date
+from src.common.utils.worker import concurrency_aio
 from src.domain.entities.feature import Feature
 from src.domain.repositories.features import FeaturesRepository
 
@@ -23,21 +25,15 @@ class FeaturesGit(FeaturesRepository):
 
     async def find_all(self, options=None):
         options = options or {}
-        branch = options.get("branch", None)
 
-        from_date = parse_date(options.get("from_date"))
-        to_date = parse_date(options.get("to_date"))
+        self.logger.info(f"Traversing commits of {self.path}...")
 
-        features: list[Feature] = []
-        for commit in Repository(
-            path_to_repo=self.path,
-            only_in_branch=branch,
-            num_workers=50,
-            since=from_date,
-            to=to_date,
-        ).traverse_commits():
-            self.logger.info(f"Serialize commit {commit.hash}")
-            features.append(serialize_commit(commit, options))
+        # Traversal and diffs are CPU bound: run them in a separate process so
+        # that several repositories can be loaded at the same time
+        rows = await traverse_commits.run_all([(self.path, options)])
+        features: list[Feature] = list(itertools.chain.from_iterable(rows))
+
+        self.logger.info(f"{len(features)} commits serialized from {self.path}")
 
         # worker = GitTraversalWorker(
         #     logger=self.logger,
@@ -57,6 +53,25 @@ class FeaturesGit(FeaturesRepository):
         return features
 
 
+@concurrency_aio(max_concurrency=1, executor="process")
+def traverse_commits(path, options):
+    branch = options.get("branch", None)
+
+    from_date = parse_date(options.get("from_date"))
+    to_date = parse_date(options.get("to_date"))
+
+    return [
+        serialize_commit(commit, options)
+        for commit in Repository(
+            path_to_repo=path,
+            only_in_branch=branch,
+            num_workers=50,
+            since=from_date,
+            to=to_date,
+        ).traverse_commits()
+    ]
+
+
 def get_ddm_indicators(commit):
     return {
         "dmm_unit_complexity": commit.dmm_unit_complexity,
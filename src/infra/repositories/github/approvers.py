@@ -7,6 +7,7 @@ from src.infra.repositories.github.utils import (
     get_base_url,
     get_email,
     get_header,
+    get_page_count,
     non_blocking_error_codes,
 )
 
@@ -19,6 +20,7 @@ class ApproversGithubRepository(DeveloperRepository):
         self.pagination = {
             "max_concurrency": 3,
             "items_per_page": 100,
+            "fan_out": True,
             **pagination,
         }
         self.git_repository = Repository.parse(git_repository)
@@ -52,10 +54,11 @@ class ApproversGithubRepository(DeveloperRepository):
             f"Fetching approvers in {self.git_repository} Github for {len(pull_requests)} pull requests"
         )
 
-        rows = await self.__get_reviewers_for_pull_request.run_all(self, pull_requests)
-
         approvers = []
-        for approvers_for_pull_request, pull_request in rows:
+        async for (
+            approvers_for_pull_request,
+            pull_request,
+        ) in self.__get_reviewers_for_pull_request.stream(self, pull_requests):
             approvers.append(
                 (
                     [
@@ -78,6 +81,9 @@ class ApproverPaginatorWorker(PaginatorWorker):
     async def get_url(self, page: int) -> str:
         return f"{get_base_url(self.git_repository)}/pulls/{self.pull_request.source_id}/reviews?per_page={self.items_per_page}&page={page + 1}"
 
+    def get_page_count(self, headers):
+        return get_page_count(headers)
+
     async def process_data(self, data, options=None):
         rows = data
         if len(rows) == 0:
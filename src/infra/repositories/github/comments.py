@@ -1,5 +1,3 @@
-import itertools
-
 from src.common.utils.worker import concurrency_aio
 from src.domain.entities.comment import Comment
 from src.domain.repositories.comments import CommentsRepository
@@ -8,6 +6,7 @@ from src.infra.repositories.github.utils import (
     get_base_url,
     get_email,
     get_header,
+    get_page_count,
     non_blocking_error_codes,
 )
 
@@ -18,6 +17,7 @@ class CommentsGithubRepository(CommentsRepository):
         self.pagination = {
             "max_concurrency": 3,
             "items_per_page": 100,
+            "fan_out": True,
             **pagination,
         }
 
@@ -53,16 +53,15 @@ class CommentsGithubRepository(CommentsRepository):
             f"Fetching comments in {self.git_repository} Github for {len(pull_requests)} pull requests"
         )
 
-        rows = await self.__get_comments_for_pull_request.run_all(
-            self, [(pull_request, exclude_ids) for pull_request in pull_requests]
-        )
         comments = []
-
-        for row in itertools.chain.from_iterable(rows):
-            author = row["developer"]["full_name"]
-            if author in authors_to_exclude:
-                continue
-            comments.append(Comment.from_dict(row))
+        async for rows in self.__get_comments_for_pull_request.stream(
+            self, ((pull_request, exclude_ids) for pull_request in pull_requests)
+        ):
+            for row in rows:
+                author = row["developer"]["full_name"]
+                if author in authors_to_exclude:
+                    continue
+                comments.append(Comment.from_dict(row))
 
         return comments
 
@@ -76,6 +75,9 @@ class CommentPaginatorWorker(PaginatorWorker):
     async def get_url(self, page: int) -> str:
         return f"{get_base_url(self.git_repository)}/pulls/{self.pull_request.source_id}/comments?per_page={self.items_per_page}&page={page + 1}"
 
+    def get_page_count(self, headers):
+        return get_page_count(headers)
+
     async def process_data(self, data, options=None):
         rows = data
         if len(rows) == 0:
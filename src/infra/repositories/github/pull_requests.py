@@ -1,12 +1,18 @@
 from collections import defaultdict
 
+from src.common.utils.async_iterator_prefetch import AsyncPrefetchIterator
 from src.common.utils.date import parse_date
 from src.domain.entities.pull_request import PullRequest
 from src.domain.repositories.pull_requests import PullRequestsRepository
 from src.infra.paginator_fetcher import PaginatorWorker
 from src.infra.repositories.github.approvers import ApproversGithubRepository
 from src.infra.repositories.github.comments import CommentsGithubRepository
-from src.infra.repositories.github.utils import get_base_url, get_email, get_header
+from src.infra.repositories.github.utils import (
+    get_base_url,
+    get_email,
+    get_header,
+    get_page_count,
+)
 
 
 class PullRequestsGithubRepository(PullRequestsRepository):
@@ -15,10 +21,11 @@ class PullRequestsGithubRepository(PullRequestsRepository):
         self.pagination = {
             "max_concurrency": 20,
             "items_per_page": 100,
+            "fan_out": True,
             **pagination,
         }
 
-    async def __get_pull_requests_from_github(self, start_date, end_date):
+    async def __get_pages_from_github(self, start_date, end_date):
         worker = PullRequestPaginatorWorker(
             start_date=start_date,
             end_date=end_date,
@@ -28,69 +35,84 @@ class PullRequestsGithubRepository(PullRequestsRepository):
             **self.pagination,
         )
 
-        pull_requests: list[dict] = []
-        iterator = await worker.fetch()
-        async for row in iterator:
-            pull_requests = pull_requests + row
+        # Next pages are fetched while the current batch is enriched
+        pages = AsyncPrefetchIterator(await worker.fetch())
+        try:
+            async for rows in pages:
+                yield rows
+        finally:
+            await pages.aclose()
+
+    async def __complete(self, pull_requests: list[PullRequest]):
+        # Gettings approvers
+        approvers_repo = ApproversGithubRepository(
+            logger=self.logger, git_repository=self.git_repository
+        )
+        approvers_and_pull_request = await approvers_repo.find_all(
+            {"pull_requests": pull_requests}
+        )
+        approvers_by_pull_request_id = defaultdict(list)
+        for approvers, pull_request in approvers_and_pull_request:
+            approvers_by_pull_request_id[pull_request.id] = approvers
+
+        # Getting comments
+        comments_by_pull_request_id = defaultdict(list)
+        comments_repo = CommentsGithubRepository(
+            logger=self.logger, git_repository=self.git_repository
+        )
+        comments = await comments_repo.find_all({"pull_requests": pull_requests})
+        for comment in comments:
+            comments_by_pull_request_id[comment.pull_request_id].append(comment)
 
-        return pull_requests
+        # Complete data
+        for pull_request in pull_requests:
+            pull_request.comments = comments_by_pull_request_id[pull_request.id]
+            pull_request.approvers = approvers_by_pull_request_id[pull_request.id]
 
-    async def find_all(self, filters=None):
+    async def find_all_in_batches(self, filters=None, batch_size=100):
         filters = filters or {}
 
         start_date = parse_date(filters.get("start_date"))
         end_date = parse_date(filters.get("end_date"))
         exclude_ids = set([str(id) for id in filters.get("exclude_ids", [])])
+        known_versions = filters.get("known_versions") or {}
 
         self.logger.info(
-            f"Fetching pull requests in {self.git_repository} Azure from {start_date} to {end_date}"
-        )
-
-        pull_requests_from_azure = await self.__get_pull_requests_from_github(
-            start_date, end_date
+            f"Fetching pull requests in {self.git_repository} Github from {start_date} to {end_date}"
         )
 
         pull_requests: list[PullRequest] = []
-        for pr in pull_requests_from_azure:
-            source_id = str(pr["source_id"])
-            if source_id in exclude_ids:
-                continue
-
-            is_merged = pr["is_merged"]
-            if not is_merged:
-                continue
-
-            pull_request = PullRequest.from_dict(
-                {"git_repository": self.git_repository, **pr}
-            )
-            pull_requests.append(pull_request)
+        async for rows in self.__get_pages_from_github(start_date, end_date):
+            for pr in rows:
+                source_id = str(pr["source_id"])
+                if source_id in exclude_ids:
+                    continue
+                if known_versions.get(source_id) == pr["remote_version"]:
+                    # Unchanged since its last load: comments and approvers too
+                    continue
+
+                is_merged = pr["is_merged"]
+                if not is_merged:
+                    continue
+
+                pull_request = PullRequest.from_dict(
+                    {"git_repository": self.git_repository, **pr}
+                )
+                pull_requests.append(pull_request)
+
+            if len(pull_requests) >= batch_size:
+                await self.__complete(pull_requests)
+                yield pull_requests
+                pull_requests = []
 
         if pull_requests:
-            # Gettings approvers
-            approvers_repo = ApproversGithubRepository(
-                logger=self.logger, git_repository=self.git_repository
-            )
-            approvers_and_pull_request = await approvers_repo.find_all(
-                {"pull_requests": pull_requests}
-            )
-            approvers_by_pull_request_id = defaultdict(list)
-            for approvers, pull_request in approvers_and_pull_request:
-                approvers_by_pull_request_id[pull_request.id] = approvers
-
-            # Getting comments
-            comments_by_pull_request_id = defaultdict(list)
-            comments_repo = CommentsGithubRepository(
-                logger=self.logger, git_repository=self.git_repository
-            )
-            comments = await comments_repo.find_all({"pull_requests": pull_requests})
-            for comment in comments:
-                comments_by_pull_request_id[comment.pull_request_id].append(comment)
-
-            # Complete data
-            for pull_request in pull_requests:
-                pull_request.comments = comments_by_pull_request_id[pull_request.id]
-                pull_request.approvers = approvers_by_pull_request_id[pull_request.id]
+            await self.__complete(pull_requests)
+            yield pull_requests
 
+    async def find_all(self, filters=None):
+        pull_requests: list[PullRequest] = []
+        async for batch in self.find_all_in_batches(filters):
+            pull_requests += batch
         return pull_requests
 
 
@@ -102,13 +124,23 @@ class PullRequestPaginatorWorker(PaginatorWorker):
         super().__init__(*args, **kwargs)
 
     async def get_url(self, page: int) -> str:
-        return f"{get_base_url(self.git_repository)}/pulls?state=closed&per_page={self.items_per_page}&page={page + 1}"
+        # Most recently updated first: pagination stops once start_date is passed
+        return f"{get_base_url(self.git_repository)}/pulls?state=closed&sort=updated&direction=desc&per_page={self.items_per_page}&page={page + 1}"
+
+    def get_page_count(self, headers):
+        return get_page_count(headers)
 
     async def process_data(self, data, options=None):
         rows = data
         if len(rows) == 0:
             return [], False
 
+        # A pull request is updated after its creation: once a whole page has been
+        # updated before start_date, it and the next pages were created before it
+        is_before_start_date = self.start_date is not None and all(
+            parse_date(row["updated_at"]) < self.start_date for row in rows
+        )
+
         transformed_rows = []
 
         for row in rows:
@@ -144,7 +176,11 @@ class PullRequestPaginatorWorker(PaginatorWorker):
                     "target_branch": row["base"]["ref"],
                     "commit": row["merge_commit_sha"],
                     "previous_commit": row["base"]["sha"],
+                    "remote_version": row["updated_at"],
                 }
             )
 
-        return transformed_rows, len(transformed_rows) == self.items_per_page
+        return (
+            transformed_rows,
+            len(rows) == self.items_per_page and not is_before_start_date,
+        )
@@ -0,0 +1,285 @@
+from src.common.utils.async_iterator_prefetch import AsyncPrefetchIterator
+from src.common.utils.date import parse_date
+from src.domain.entities.pull_request import PullRequest
+from src.domain.repositories.pull_requests import PullRequestsRepository
+from src.infra.paginator_fetcher import RequestException
+from src.infra.repositories.github.approvers import ApproversGithubRepository
+from src.infra.repositories.github.comments import CommentsGithubRepository
+from src.infra.repositories.github.utils import get_email, get_graphql_url, get_header
+from src.infra.requests.fetch import async_fetch
+
+# Nested connections are bounded to keep each query under Github node limit
+# (pull requests x threads x comments must stay below 500 000)
+PULL_REQUESTS_QUERY = """
+query (
+  $owner: String!
+  $name: String!
+  $itemsPerPage: Int!
+  $nestedItemsPerPage: Int!
+  $cursor: String
+) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(
+      states: MERGED
+      first: $itemsPerPage
+      after: $cursor
+      orderBy: {field: CREATED_AT, direction: DESC}
+    ) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        number
+        title
+        createdAt
+        updatedAt
+        mergedAt
+        author {
+          login
+        }
+        headRefName
+        baseRefName
+        baseRefOid
+        mergeCommit {
+          oid
+        }
+        reviews(states: APPROVED, first: $nestedItemsPerPage) {
+          pageInfo {
+            hasNextPage
+          }
+          nodes {
+            author {
+              login
+            }
+          }
+        }
+        reviewThreads(first: $nestedItemsPerPage) {
+          pageInfo {
+            hasNextPage
+          }
+          nodes {
+            comments(first: $nestedItemsPerPage) {
+              pageInfo {
+                hasNextPage
+              }
+              nodes {
+                author {
+                  login
+                }
+                body
+                createdAt
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Login of the accounts that have been deleted
+GHOST_LOGIN = "ghost"
+
+
+class PullRequestsGithubGraphqlRepository(PullRequestsRepository):
+    """
+    Loads merged pull requests with their approvers and review comments from the
+    Github GraphQL API, in one paginated query instead of one REST call per pull
+    request for reviews and another one for comments.
+
+    Pull requests with more reviews or comments than a page can hold are completed
+    with the REST repositories.
+    """
+
+    def __init__(self, pagination={}, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pagination = {
+            "items_per_page": 25,
+            "nested_items_per_page": 50,
+            **pagination,
+        }
+
+    async def __get_pages_from_github(self, start_date, end_date):
+        cursor = None
+        has_next_page = True
+        while has_next_page:
+            self.logger.info(
+                f"Fetching pull requests in {self.git_repository} Github GraphQL after {cursor}"
+            )
+            page = await self.__fetch_page(cursor)
+
+            pull_requests: list[dict] = []
+            incomplete_ids: set[str] = set()
+            is_before_start_date = False
+            for row in page["nodes"]:
+                creation_date = parse_date(row["createdAt"])
+                if start_date is not None and creation_date < start_date:
+                    # Pull requests are sorted by creation date, older ones are not needed
+                    is_before_start_date = True
+                    break
+                if end_date is not None and creation_date > end_date:
+                    continue
+
+                pull_request, is_complete = self.__transform(row)
+                pull_requests.append(pull_request)
+                if not is_complete:
+                    incomplete_ids.add(pull_request["source_id"])
+
+            yield pull_requests, incomplete_ids
+
+            has_next_page = page["pageInfo"]["hasNextPage"] and not is_before_start_date
+            cursor = page["pageInfo"]["endCursor"]
+
+    async def __fetch_page(self, cursor):
+        data = await async_fetch(
+            get_graphql_url(),
+            headers=get_header(self.git_repository),
+            json={
+                "query": PULL_REQUESTS_QUERY,
+                "variables": {
+                    "owner": self.git_repository.project
+                    or self.git_repository.organisation,
+                    "name": self.git_repository.name,
+                    "itemsPerPage": self.pagination["items_per_page"],
+                    "nestedItemsPerPage": self.pagination["nested_items_per_page"],
+                    "cursor": cursor,
+                },
+            },
+        )
+
+        if data.get("errors"):
+            messages = ", ".join(error.get("message") for error in data["errors"])
+            raise RequestException(f"Github GraphQL errors: {messages}")
+
+        return data["data"]["repository"]["pullRequests"]
+
+    def __transform(self, row):
+        threads = row["reviewThreads"]
+        is_complete = not (
+            row["reviews"]["pageInfo"]["hasNextPage"]
+            or threads["pageInfo"]["hasNextPage"]
+            or any(
+                thread["comments"]["pageInfo"]["hasNextPage"]
+                for thread in threads["nodes"]
+            )
+        )
+
+        pull_request = {
+            "creation_date": row["createdAt"],
+            "completion_date": row["mergedAt"],
+            "created_by": get_developer(row["author"]),
+            "source_id": str(row["number"]),
+            "git_repository": self.git_repository,
+            "approvers": [
+                get_developer(review["author"]) for review in row["reviews"]["nodes"]
+            ],
+            "comments": [
+                {
+                    "creation_date": comment["createdAt"],
+                    "content": comment["body"],
+                    "developer": get_developer(comment["author"]),
+                }
+                for thread in threads["nodes"]
+                for comment in thread["comments"]["nodes"]
+            ],
+            "title": row["title"],
+            "source_branch": row["headRefName"],
+            "target_branch": row["baseRefName"],
+            "commit": (row["mergeCommit"] or {}).get("oid"),
+            "previous_commit": row["baseRefOid"],
+            "remote_version": row["updatedAt"],
+        }
+
+        return pull_request, is_complete
+
+    async def __complete_with_rest(self, pull_requests: list[PullRequest]):
+        approvers_repo = ApproversGithubRepository(
+            logger=self.logger, git_repository=self.git_repository
+        )
+        for approvers, pull_request in await approvers_repo.find_all(
+            {"pull_requests": pull_requests}
+        ):
+            pull_request.approvers = approvers
+
+        comments_repo = CommentsGithubRepository(
+            logger=self.logger, git_repository=self.git_repository
+        )
+        comments = await comments_repo.find_all({"pull_requests": pull_requests})
+        for pull_request in pull_requests:
+            pull_request.comments = [
+                comment
+                for comment in comments
+                if comment.pull_request_id == pull_request.id
+            ]
+
+    async def __complete_batch(
+        self, pull_requests: list[PullRequest], incomplete_ids: set[str]
+    ):
+        incomplete_pull_requests = [
+            pull_request
+            for pull_request in pull_requests
+            if pull_request.source_id in incomplete_ids
+        ]
+        if incomplete_pull_requests:
+            self.logger.info(
+                f"Completing {len(incomplete_pull_requests)} pull requests in {self.git_repository} with Github REST API"
+            )
+            await self.__complete_with_rest(incomplete_pull_requests)
+
+    async def find_all_in_batches(self, filters=None, batch_size=100):
+        filters = filters or {}
+
+        start_date = parse_date(filters.get("start_date"))
+        end_date = parse_date(filters.get("end_date"))
+        exclude_ids = set([str(id) for id in filters.get("exclude_ids", [])])
+        known_versions = filters.get("known_versions") or {}
+
+        self.logger.info(
+            f"Fetching pull requests in {self.git_repository} Github GraphQL from {start_date} to {end_date}"
+        )
+
+        pull_requests: list[PullRequest] = []
+        incomplete_ids: set[str] = set()
+
+        # Next page is fetched while the current batch is completed
+        pages = AsyncPrefetchIterator(
+            self.__get_pages_from_github(start_date, end_date)
+        )
+        try:
+            async for rows, page_incomplete_ids in pages:
+                for pr in rows:
+                    if pr["source_id"] in exclude_ids:
+                        continue
+                    if known_versions.get(pr["source_id"]) == pr["remote_version"]:
+                        # Unchanged since its last load
+                        continue
+                    pull_requests.append(PullRequest.from_dict(pr))
+                incomplete_ids |= page_incomplete_ids
+
+                if len(pull_requests) >= batch_size:
+                    await self.__complete_batch(pull_requests, incomplete_ids)
+                    yield pull_requests
+                    pull_requests = []
+                    incomplete_ids = set()
+        finally:
+            await pages.aclose()
+
+        if pull_requests:
+            await self.__complete_batch(pull_requests, incomplete_ids)
+            yield pull_requests
+
+    async def find_all(self, filters=None):
+        pull_requests: list[PullRequest] = []
+        async for batch in self.find_all_in_batches(filters):
+            pull_requests += batch
+        return pull_requests
+
+
+def get_developer(author):
+    login = (author or {}).get("login") or GHOST_LOGIN
+    return {
+        "full_name": login,
+        "email": get_email(login),
+    }
@@ -1,4 +1,6 @@
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 
 @pytest.fixture
@@ -29,7 +31,7 @@ def mock_api_approvers(mocker_aio):
 def mock_api_pull_requests(mocker_aio):
     def mock(payload, per_page=100, page=1):
         mocker_aio.get(
-            f"https://api.github.com/repos/orga/myrepo/pulls?state=closed&per_page={per_page}&page={page}",
+            f"https://api.github.com/repos/orga/myrepo/pulls?state=closed&sort=updated&direction=desc&per_page={per_page}&page={page}",
             payload=payload,
         )
 
@@ -147,3 +149,89 @@ def mock_pull_request_user_comment_2_in_github(
         "created_at": "2012-04-14T16:00:49Z",
         "updated_at": "2012-04-14T16:00:49Z",
     }
+
+
+@pytest.fixture
+async def github_graphql_server(mocker):
+    """
+    Local server standing in for Github GraphQL API: each query gets the page
+    registered for its cursor.
+    """
+    pages: dict = {}
+    queries: list = []
+
+    async def graphql(request):
+        body = await request.json()
+        queries.append(body)
+        return web.json_response(pages[body["variables"]["cursor"]])
+
+    app = web.Application()
+    app.router.add_post("/graphql", graphql)
+
+    server = TestServer(app)
+    await server.start_server()
+    mocker.patch(
+        "src.infra.repositories.github.utils.settings.github_api_url",
+        str(server.make_url("")).rstrip("/"),
+    )
+
+    def add_page(pull_requests, cursor=None, next_cursor=None, errors=None):
+        if errors:
+            pages[cursor] = {"data": None, "errors": errors}
+            return
+
+        pages[cursor] = {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "pageInfo": {
+                            "hasNextPage": next_cursor is not None,
+                            "endCursor": next_cursor,
+                        },
+                        "nodes": pull_requests,
+                    }
+                }
+            }
+        }
+
+    add_page.queries = queries  # type: ignore
+    yield add_page
+
+    await server.close()
+
+
+@pytest.fixture
+def mock_pull_request_in_github_graphql():
+    return {
+        "number": 1234,
+        "title": "Amazing new feature",
+        "createdAt": "2011-01-26T12:01:12Z",
+        "updatedAt": "2011-01-26T12:04:12Z",
+        "mergedAt": "2011-01-26T12:03:12Z",
+        "author": {"login": "octocat"},
+        "headRefName": "new-topic",
+        "baseRefName": "master",
+        "baseRefOid": "6dcb09b5b57875f334f61aebed695e2e4193db5e",
+        "mergeCommit": {"oid": "e5bd3914e2e596debea16f433f57875b5b90bcd6"},
+        "reviews": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [{"author": {"login": "approveruser"}}],
+        },
+        "reviewThreads": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [
+                {
+                    "comments": {
+                        "pageInfo": {"hasNextPage": False},
+                        "nodes": [
+                            {
+                                "author": {"login": "octocat"},
+                                "body": "Great stuff!",
+                                "createdAt": "2011-04-14T16:00:49Z",
+                            }
+                        ],
+                    }
+                }
+            ],
+        },
+    }
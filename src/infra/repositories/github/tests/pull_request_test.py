@@ -155,6 +155,36 @@ async def test_does_use_pagination(
     assert len(pull_requests) == 2
 
 
+async def test_yields_enriched_pull_requests_by_batches(
+    mock_completed_pull_request_in_github,
+    mock_completed_pull_request_2_in_github,
+    mock_approvers_in_github,
+    repository_pagination,
+    mock_api_pull_requests,
+    mock_api_approvers,
+    mock_api_comments,
+):
+    mock_api_pull_requests([mock_completed_pull_request_in_github], per_page=1, page=1)
+    mock_api_pull_requests(
+        [mock_completed_pull_request_2_in_github], per_page=1, page=2
+    )
+    mock_api_pull_requests([], per_page=1, page=3)
+    mock_api_approvers(1234, mock_approvers_in_github)
+    mock_api_approvers(789, [])
+    mock_api_comments(1234, [])
+    mock_api_comments(789, [])
+
+    batches = [
+        batch async for batch in repository_pagination.find_all_in_batches(batch_size=1)
+    ]
+
+    assert [[pr.source_id for pr in batch] for batch in batches] == [
+        ["1234"],
+        ["789"],
+    ]
+    assert len(batches[0][0].approvers) == 1
+
+
 async def test_stops_using_pagination_with_dates(
     mock_completed_pull_request_in_github,
     repository_pagination,
@@ -164,13 +194,44 @@ async def test_stops_using_pagination_with_dates(
 
     pull_requests = await repository_pagination.find_all(
         {
-            "end_date": "2010-10-15",
+            "start_date": "2020-10-15",
         }
     )
 
     assert len(pull_requests) == 0
 
 
+async def test_keeps_using_pagination_until_start_date(
+    mock_completed_pull_request_in_github,
+    mock_completed_pull_request_2_in_github,
+    repository_pagination,
+    mock_api_pull_requests,
+    mock_api_approvers,
+    mock_api_comments,
+):
+    # Updated in the window, but created before it
+    mock_api_pull_requests(
+        [{**mock_completed_pull_request_in_github, "updated_at": "2011-03-01"}],
+        per_page=1,
+        page=1,
+    )
+    mock_api_pull_requests(
+        [{**mock_completed_pull_request_2_in_github, "created_at": "2011-02-15"}],
+        per_page=1,
+        page=2,
+    )
+    mock_api_approvers(789, [])
+    mock_api_comments(789, [])
+
+    pull_requests = await repository_pagination.find_all(
+        {
+            "start_date": "2011-02-01",
+        }
+    )
+
+    assert [pull_request.source_id for pull_request in pull_requests] == ["789"]
+
+
 async def test_filters_out_pull_requests_with_date_before_start_date(
     mock_completed_pull_request_in_github, repository, mock_api_pull_requests
 ):
@@ -231,3 +292,31 @@ async def test_filters_out_pull_requests_with_exclude_filter(
     )
 
     assert len(pull_requests) == 0
+
+
+async def test_fetches_the_pages_given_by_link_header(
+    mock_completed_pull_request_in_github,
+    mock_completed_pull_request_2_in_github,
+    repository_pagination,
+    mocker_aio,
+    mock_api_pull_requests,
+    mock_api_approvers,
+    mock_api_comments,
+):
+    url = "https://api.github.com/repos/orga/myrepo/pulls?state=closed&sort=updated&direction=desc&per_page=1"
+    mocker_aio.get(
+        f"{url}&page=1",
+        payload=[mock_completed_pull_request_in_github],
+        headers={"Link": f'<{url}&page=2>; rel="next", <{url}&page=2>; rel="last"'},
+    )
+    mock_api_pull_requests(
+        [mock_completed_pull_request_2_in_github], per_page=1, page=2
+    )
+    mock_api_approvers(1234, [])
+    mock_api_approvers(789, [])
+    mock_api_comments(1234, [])
+    mock_api_comments(789, [])
+
+    pull_requests = await repository_pagination.find_all()
+
+    assert len(pull_requests) == 2
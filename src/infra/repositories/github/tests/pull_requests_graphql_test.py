@@ -0,0 +1,172 @@
+import pytest
+
+from src.domain.entities.developer import Developer
+from src.domain.entities.repository import Repository
+from src.domain.entities.types import RepositoryApis
+from src.infra.paginator_fetcher import RequestException
+from src.infra.repositories.factory import get_repositories_for_git_repository
+from src.infra.repositories.github.pull_requests_graphql import (
+    PullRequestsGithubGraphqlRepository,
+)
+
+
+@pytest.fixture
+def repository(mock_logger):
+    return PullRequestsGithubGraphqlRepository(
+        logger=mock_logger,
+        git_repository={
+            "name": "myrepo",
+            "organisation": "orga",
+        },
+    )
+
+
+def test_is_selected_by_repository():
+    repository = Repository.parse(
+        {
+            "name": "myrepo",
+            "organisation": "orga",
+            "url": "git@github.com:orga/myrepo.git",
+            "api": RepositoryApis.GRAPHQL,
+        }
+    )
+
+    repositories = get_repositories_for_git_repository(repository)
+
+    assert repositories["pull_requests"] == PullRequestsGithubGraphqlRepository
+
+
+async def test_creates_pull_requests_with_approvers_and_comments(
+    repository, github_graphql_server, mock_pull_request_in_github_graphql
+):
+    github_graphql_server([mock_pull_request_in_github_graphql])
+
+    pull_requests = await repository.find_all()
+
+    assert len(pull_requests) == 1
+    assert pull_requests[0].to_dict() == {
+        "source_id": "1234",
+        "approvers": [
+            {
+                'email': 'approveruser@github.com',
+                'full_name': 'approveruser',
+                'id': 'approveruser@github.com',
+            }
+        ],
+        "comments": [
+            {
+                "pull_request_id": pull_requests[0].id,
+                "creation_date": "2011-04-14T16:00:49Z",
+                "content": "Great stuff!",
+                "developer": {
+                    "full_name": "octocat",
+                    "email": "octocat@github.com",
+                },
+                "id": pull_requests[0].comments[0].id,
+                "size": 12,
+            }
+        ],
+        "created_by": {
+            "full_name": "octocat",
+            "email": "octocat@github.com",
+            "id": "octocat@github.com",
+        },
+        "creation_date": "2011-01-26T12:01:12Z",
+        "completion_date": "2011-01-26T12:03:12Z",
+        "title": "Amazing new feature",
+        "source_branch": "new-topic",
+        "target_branch": "master",
+        "commit": "e5bd3914e2e596debea16f433f57875b5b90bcd6",
+        "previous_commit": "6dcb09b5b57875f334f61aebed695e2e4193db5e",
+        "git_repository": "orga/myrepo",
+        "type": "feature",
+        "merge_time": 2.0,
+        "first_comment_delay": 30479.0,
+    }
+
+
+async def test_does_use_pagination(
+    repository, github_graphql_server, mock_pull_request_in_github_graphql
+):
+    github_graphql_server([mock_pull_request_in_github_graphql], next_cursor="page2")
+    github_graphql_server(
+        [{**mock_pull_request_in_github_graphql, "number": 789}], cursor="page2"
+    )
+
+    pull_requests = await repository.find_all()
+
+    assert [pull_request.source_id for pull_request in pull_requests] == [
+        "1234",
+        "789",
+    ]
+    assert github_graphql_server.queries[1]["variables"]["cursor"] == "page2"
+
+
+async def test_stops_using_pagination_before_start_date(
+    repository, github_graphql_server, mock_pull_request_in_github_graphql
+):
+    github_graphql_server(
+        [
+            {**mock_pull_request_in_github_graphql, "createdAt": "2020-10-16"},
+            {**mock_pull_request_in_github_graphql, "number": 789},
+        ],
+        next_cursor="page2",
+    )
+
+    pull_requests = await repository.find_all(
+        {"start_date": "2020-10-15", "end_date": "2020-10-17"}
+    )
+
+    assert [pull_request.source_id for pull_request in pull_requests] == ["1234"]
+    assert len(github_graphql_server.queries) == 1
+
+
+async def test_filters_out_pull_requests_with_exclude_filter(
+    repository, github_graphql_server, mock_pull_request_in_github_graphql
+):
+    github_graphql_server([mock_pull_request_in_github_graphql])
+
+    pull_requests = await repository.find_all({"exclude_ids": [1234]})
+
+    assert len(pull_requests) == 0
+
+
+async def test_completes_truncated_pull_requests_with_rest(
+    mocker, repository, github_graphql_server, mock_pull_request_in_github_graphql
+):
+    approver = Developer(full_name="other", email="other@github.com")
+    find_approvers = mocker.patch(
+        "src.infra.repositories.github.pull_requests_graphql.ApproversGithubRepository.find_all",
+        side_effect=lambda filters: [([approver], filters["pull_requests"][0])],
+    )
+    mocker.patch(
+        "src.infra.repositories.github.pull_requests_graphql.CommentsGithubRepository.find_all",
+        return_value=[],
+    )
+    truncated_reviews = {
+        "pageInfo": {"hasNextPage": True},
+        "nodes": [{"author": {"login": "approveruser"}}],
+    }
+    github_graphql_server(
+        [
+            {**mock_pull_request_in_github_graphql, "reviews": truncated_reviews},
+            {**mock_pull_request_in_github_graphql, "number": 789},
+        ]
+    )
+
+    pull_requests = await repository.find_all()
+
+    assert [
+        pull_request.source_id
+        for pull_request in find_approvers.call_args[0][0]["pull_requests"]
+    ] == ["1234"]
+    assert pull_requests[0].approvers == [approver]
+    assert len(pull_requests[1].approvers) == 1
+    assert len(pull_requests[1].comments) == 1
+
+
+async def test_raises_graphql_errors(repository, github_graphql_server):
+    github_graphql_server([], errors=[{"message": "Could not resolve to a Repository"}])
+
+    with pytest.raises(RequestException):
+        await repository.find_all()
@@ -1,3 +1,7 @@
+from typing import Mapping, Optional
+from urllib.parse import parse_qs, urlparse
+
+from src.common.settings import settings
 from src.domain.entities.repository import Repository
 
 non_blocking_error_codes = [403]
@@ -14,4 +18,18 @@ def get_email(login):
 
 
 def get_base_url(repository: Repository) -> str:
-    return f"https://api.github.com/repos/{repository.project or repository.organisation}/{repository.name}"
+    return f"{settings.github_api_url}/repos/{repository.project or repository.organisation}/{repository.name}"
+
+
+def get_graphql_url() -> str:
+    return f"{settings.github_api_url}/graphql"
+
+
+def get_page_count(headers: Mapping[str, str]) -> Optional[int]:
+    """Reads the page count in the `rel="last"` link of a paginated response."""
+    for link in headers.get("Link", "").split(","):
+        url, _, rel = link.partition(";")
+        if 'rel="last"' in rel:
+            pages = parse_qs(urlparse(url.strip(" <>")).query).get("page")
+            return int(pages[0]) if pages else None
+    return None
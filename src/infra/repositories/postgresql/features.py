@@ -5,6 +5,7 @@ from src.domain.repositories.features import FeaturesRepository
 from src.domain.repositories.utils import (
     raise_exception_if_repository_differs_from_entity,
 )
+from src.infra.database.postgresql.database import get_db_session
 from src.infra.database.postgresql.models.models import Feature as FeatureModel
 from src.infra.repositories.postgresql.generic_db import GenericDatabaseRepository
 from src.infra.repositories.postgresql.upsert_all_developers import (
@@ -34,6 +35,16 @@ class FeaturesDatabaseRepository(
         await self.upsert_all_developers(entities, related_objects_options)
         await self._upsert_all_entities_within_transaction(entities, options)
 
+    async def get_last_feature(self):
+        async with get_db_session() as session:
+            query = await self._select_find_all(session)
+            result = await session.execute(
+                query.order_by(self.Model.date.desc()).limit(1)
+            )
+            row = result.scalar_one_or_none()
+
+        return self.Model.to_entity(row) if row else None
+
     async def _select_find_all(self, session, options=None):
         Model = self.Model
 
@@ -1,11 +1,11 @@
-from sqlalchemy import delete, insert, select
+from sqlalchemy import delete, func, insert, select, text
 from sqlalchemy.orm import joinedload, subqueryload
 
 from src.domain.repositories.pull_requests import PullRequestsRepository
 from src.domain.repositories.utils import (
     raise_exception_if_repository_differs_from_entity,
 )
-from src.infra.database.postgresql.database import start_transaction
+from src.infra.database.postgresql.database import get_db_session, start_transaction
 from src.infra.database.postgresql.models.models import PullRequest as PullRequestModel
 from src.infra.repositories.postgresql.comments import CommentsDatabaseRepository
 from src.infra.repositories.postgresql.generic_db import GenericDatabaseRepository
@@ -13,12 +13,30 @@ from src.infra.repositories.postgresql.upsert_all_developers import (
     UpsertAllDevelopersMixin,
 )
 
+# Tables checked in this process
+checked_tables: set[str] = set()
+
 
 class PullRequestsDatabaseRepository(
     PullRequestsRepository, GenericDatabaseRepository, UpsertAllDevelopersMixin
 ):
     Model = PullRequestModel
 
+    async def _add_remote_version_column_if_needed(self):
+        # Databases initialised before remote versions were stored do not have it
+        table = self.Model.__table__
+        if table.fullname in checked_tables:
+            return
+
+        async with start_transaction() as session:
+            await session.execute(
+                text(
+                    f"ALTER TABLE {table.fullname} ADD COLUMN IF NOT EXISTS remote_version VARCHAR"
+                )
+            )
+            await session.commit()
+        checked_tables.add(table.fullname)
+
     async def upsert_all_pull_request(self, entities, options=None):
         options = options or {}
 
@@ -84,10 +102,39 @@ class PullRequestsDatabaseRepository(
             self.git_repository, entities[0]
         )
 
+        await self._add_remote_version_column_if_needed()
         await self.upsert_all_developers(entities, options)
         await self.upsert_all_pull_request(entities, {**options, "is_new": is_new})
         await self.upsert_all_comments(entities, {**options, "is_new": is_new})
 
+    async def find_all(self, options=None):
+        await self._add_remote_version_column_if_needed()
+        return await super().find_all(options)
+
+    async def get_by_id(self, id):
+        await self._add_remote_version_column_if_needed()
+        return await super().get_by_id(id)
+
+    async def get_last_completion_date(self):
+        async with get_db_session() as session:
+            query = select(func.max(self.Model.completion_date)).filter(
+                self.Model.repository == self.git_repository.path
+            )
+            result = await session.execute(query)
+            return result.scalar()
+
+    async def get_remote_versions(self, start_date=None) -> dict[str, str]:
+        await self._add_remote_version_column_if_needed()
+        async with get_db_session() as session:
+            query = select(self.Model.source_id, self.Model.remote_version).filter(
+                self.Model.repository == self.git_repository.path,
+                self.Model.remote_version.is_not(None),
+            )
+            if start_date is not None:
+                query = query.filter(self.Model.creation_date >= start_date)
+            result = await session.execute(query)
+            return {source_id: version for source_id, version in result.all()}
+
     async def _select_find_all(self, session, options=None):
         filters = options or {}
 
@@ -0,0 +1,84 @@
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.domain.entities.sync_state import SyncState
+from src.domain.repositories.sync_states import SyncStatesRepository
+from src.infra.database.postgresql.database import get_db_session, start_transaction
+from src.infra.database.postgresql.models.models import SyncState as SyncStateModel
+from src.infra.repositories.postgresql.generic_db import GenericDatabaseRepository
+
+# Tables checked in this process
+checked_tables: set[str] = set()
+
+
+class SyncStatesDatabaseRepository(SyncStatesRepository, GenericDatabaseRepository):
+    Model = SyncStateModel
+
+    async def _create_table_if_needed(self):
+        # Databases initialised before this table existed do not have it
+        table = self.Model.__table__
+        if table.fullname in checked_tables:
+            return
+
+        async with start_transaction() as session:
+            await session.run_sync(
+                lambda session: table.create(session.connection(), checkfirst=True)
+            )
+            await session.commit()
+        checked_tables.add(table.fullname)
+
+    async def get(self, entity):
+        await self._create_table_if_needed()
+        async with get_db_session() as session:
+            query = select(self.Model).filter(
+                self.Model.id == SyncState(self.git_repository, entity).id
+            )
+            result = await session.execute(query)
+            row = result.scalar_one_or_none()
+
+        return self.Model.to_entity(row) if row else None
+
+    async def advance(
+        self, entity, last_date=None, last_commit=None, last_etag=None
+    ) -> None:
+        sync_state = SyncState(
+            git_repository=self.git_repository,
+            entity=entity,
+            last_date=last_date,
+            last_commit=last_commit,
+            last_etag=last_etag,
+        )
+        table = self.Model.__table__
+        statement = insert(table).values(self.Model.from_entity(sync_state))
+
+        # A single statement: concurrent loads cannot move the watermark backward
+        excluded = statement.excluded
+        is_not_older = (
+            table.c.last_date.is_(None)
+            | excluded.last_date.is_(None)
+            | (excluded.last_date >= table.c.last_date)
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={
+                "last_date": func.greatest(table.c.last_date, excluded.last_date),
+                "last_commit": case(
+                    (
+                        is_not_older & excluded.last_commit.is_not(None),
+                        excluded.last_commit,
+                    ),
+                    else_=table.c.last_commit,
+                ),
+                "last_etag": func.coalesce(excluded.last_etag, table.c.last_etag),
+            },
+        )
+
+        await self._create_table_if_needed()
+        async with start_transaction() as session:
+            await session.execute(statement)
+            await session.commit()
+
+    async def _select_find_all(self, session, options=None):
+        return select(self.Model).filter(
+            self.Model.repository == self.git_repository.path
+        )
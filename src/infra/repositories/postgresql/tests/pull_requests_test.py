@@ -1,5 +1,37 @@
+from src.common.utils.date import parse_date
+from src.domain.entities.pull_request import PullRequest
 from src.domain.repositories.tests.pull_requests import MixinPullRequests
 
 
 class TestDbPullRequests(MixinPullRequests):
     pass
+
+
+async def test_gets_remote_versions(
+    pull_request_repository, pull_request_repository_2, fixture_pull_request_dict
+):
+    await pull_request_repository.upsert_all(
+        [
+            PullRequest.from_dict(
+                {**fixture_pull_request_dict, "remote_version": "v1"}
+            ),
+            PullRequest.from_dict(
+                {
+                    **fixture_pull_request_dict,
+                    "source_id": "2",
+                    "creation_date": "2020-01-01T00:00:00Z",
+                    "remote_version": "v2",
+                }
+            ),
+            PullRequest.from_dict({**fixture_pull_request_dict, "source_id": "3"}),
+        ]
+    )
+
+    assert await pull_request_repository.get_remote_versions() == {
+        fixture_pull_request_dict["source_id"]: "v1",
+        "2": "v2",
+    }
+    assert await pull_request_repository.get_remote_versions(
+        parse_date("2021-01-01T00:00:00Z")
+    ) == {fixture_pull_request_dict["source_id"]: "v1"}
+    assert await pull_request_repository_2.get_remote_versions() == {}
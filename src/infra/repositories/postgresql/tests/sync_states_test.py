@@ -0,0 +1,68 @@
+import pytest
+
+from src.common.utils.date import parse_date
+from src.domain.entities.sync_state import SyncEntities
+from src.infra.repositories.postgresql.sync_states import SyncStatesDatabaseRepository
+
+
+@pytest.fixture(scope="function")
+def sync_states_repository(mock_logger):
+    return SyncStatesDatabaseRepository(
+        logger=mock_logger, git_repository="orga/myrepo"
+    )
+
+
+async def test_returns_none_without_state(sync_states_repository):
+    assert await sync_states_repository.get(SyncEntities.PULL_REQUESTS) is None
+
+
+async def test_advances_state(sync_states_repository):
+    await sync_states_repository.advance(
+        SyncEntities.FEATURES,
+        last_date=parse_date("2023-12-23T09:29:45Z"),
+        last_commit="b2ea326a",
+    )
+    await sync_states_repository.advance(
+        SyncEntities.FEATURES,
+        last_date=parse_date("2023-12-24T09:29:45Z"),
+        last_commit="97b49bad",
+        last_etag='"abc"',
+    )
+
+    sync_state = await sync_states_repository.get(SyncEntities.FEATURES)
+    assert sync_state.to_dict() == {
+        "git_repository": "orga/myrepo",
+        "entity": SyncEntities.FEATURES,
+        "last_date": "2023-12-24T09:29:45Z",
+        "last_commit": "97b49bad",
+        "last_etag": '"abc"',
+    }
+    assert await sync_states_repository.get(SyncEntities.PULL_REQUESTS) is None
+
+
+async def test_never_moves_state_backward(sync_states_repository):
+    await sync_states_repository.advance(
+        SyncEntities.FEATURES,
+        last_date=parse_date("2023-12-24T09:29:45Z"),
+        last_commit="97b49bad",
+    )
+    await sync_states_repository.advance(
+        SyncEntities.FEATURES,
+        last_date=parse_date("2023-12-23T09:29:45Z"),
+        last_commit="b2ea326a",
+    )
+
+    sync_state = await sync_states_repository.get(SyncEntities.FEATURES)
+    assert sync_state.last_date == parse_date("2023-12-24T09:29:45Z")
+    assert sync_state.last_commit == "97b49bad"
+
+
+async def test_separates_repositories(mock_logger, sync_states_repository):
+    await sync_states_repository.advance(
+        SyncEntities.PULL_REQUESTS, last_date=parse_date("2023-12-24T09:29:45Z")
+    )
+
+    other_repository = SyncStatesDatabaseRepository(
+        logger=mock_logger, git_repository="orga/anotherrepo"
+    )
+    assert await other_repository.get(SyncEntities.PULL_REQUESTS) is None
@@ -1,24 +1,72 @@
 import aiohttp
 
 from src.common.utils.async_retry import async_retry
+from src.infra.requests.http_cache import http_cache
+from src.infra.requests.rate_limiter import rate_limiter
+from src.infra.requests.session import session_manager
 
+# Number of times a rate limited request waits for the quota before failing
+MAX_RATE_LIMIT_WAITS = 5
+
+
+async def async_fetch(
+    url,
+    headers={},
+    timeout=30,
+    max_retries: int = 3,
+    client=None,
+    json=None,
+    return_headers: bool = False,
+):
+    """
+    GET the JSON at url, or POST the `json` body to it if given.
+    With `return_headers`, returns a (body, response headers) tuple.
+    """
 
-async def async_fetch(url, headers={}, timeout=30, max_retries: int = 3, client=None):
     @async_retry(max_retries=max_retries)
     async def _fetch():
-        nonlocal client
-
         if client:
-            async with client.get(url) as response:
-                response.raise_for_status()
-                return await response.json()
+            body, response_headers = await _request(
+                client, url, headers or client.headers, json
+            )
         else:
-            async with aiohttp.ClientSession(
-                headers=headers,
+            body, response_headers = await _request(
+                session_manager.get_session(),
+                url,
+                headers,
+                json,
                 timeout=aiohttp.ClientTimeout(total=timeout) if timeout else None,
-            ) as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            )
+        return (body, response_headers) if return_headers else body
 
     return await _fetch()
+
+
+async def _request(session, url, headers, json=None, **kwargs):
+    # Only GET responses are cached: a POST answer depends on its body
+    cached = http_cache.get(url, headers) if json is None else None
+    request_headers = {**headers, **http_cache.get_conditional_headers(cached)}
+
+    for attempt in range(MAX_RATE_LIMIT_WAITS + 1):
+        await rate_limiter.acquire(url, headers)
+        if json is None:
+            request = session.get(url, headers=request_headers, **kwargs)
+        else:
+            request = session.post(url, headers=request_headers, json=json, **kwargs)
+
+        async with request as response:
+            rate_limiter.update(url, headers, response.status, response.headers)
+            if (
+                rate_limiter.is_rate_limited(response.status, response.headers)
+                and attempt < MAX_RATE_LIMIT_WAITS
+            ):
+                continue
+
+            if response.status == 304 and cached is not None:
+                return cached["body"], response.headers.copy()
+
+            response.raise_for_status()
+            body = await response.json()
+            if json is None:
+                http_cache.set(url, headers, response.headers, body)
+            return body, response.headers.copy()
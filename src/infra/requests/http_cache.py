@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+from typing import Any, Mapping, Optional
+
+from src.common.settings import settings
+from src.common.utils.file import create_path_if_needed
+
+# Once full, the cache is trimmed below this ratio of its size to avoid evicting
+# entries on every write
+EVICTION_RATIO = 0.9
+
+
+class HttpCache:
+    """
+    On-disk cache of JSON responses, one file per (token, url).
+
+    The `ETag` and `Last-Modified` of each response are stored with its body and
+    sent back as `If-None-Match` / `If-Modified-Since`, so that unchanged pages are
+    answered by a `304 Not Modified` (not counted in Github rate limit) and read
+    from disk. Least recently used entries are evicted once `max_size` bytes are
+    exceeded. An empty `path` disables the cache.
+    """
+
+    def __init__(self, path: str, max_size: int):
+        self.path = path
+        self.max_size = max_size
+        self.size: Optional[int] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def get_file_path(self, url: str, headers: Optional[Mapping[str, str]]) -> str:
+        authorization = (headers or {}).get("Authorization", "")
+        key = hashlib.sha256(f"{authorization} {url}".encode("utf-8")).hexdigest()
+        return os.path.join(self.path, f"{key}.json")
+
+    def get(self, url: str, headers: Optional[Mapping[str, str]] = None):
+        if not self.enabled:
+            return None
+
+        file_path = self.get_file_path(url, headers)
+        try:
+            with open(file_path, "r") as file:
+                entry = json.load(file)
+            # Keeps track of the last use for eviction
+            os.utime(file_path)
+        except (OSError, ValueError):
+            return None
+
+        # Hash collisions are unlikely, but a wrong body would be silently used
+        return entry if entry.get("url") == url else None
+
+    def set(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        response_headers: Mapping[str, str],
+        body: Any,
+    ):
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if not self.enabled or not (etag or last_modified):
+            return
+
+        file_path = self.get_file_path(url, headers)
+        create_path_if_needed(self.path)
+        content = json.dumps(
+            {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body,
+            }
+        )
+
+        previous_size = get_file_size(file_path)
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as file:
+            file.write(content)
+        os.replace(temp_path, file_path)
+
+        self.size = self.get_size() - previous_size + get_file_size(file_path)
+        if self.size > self.max_size:
+            self.evict()
+
+    @staticmethod
+    def get_conditional_headers(entry) -> dict[str, str]:
+        if entry is None:
+            return {}
+
+        conditional_headers = {}
+        if entry.get("etag"):
+            conditional_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            conditional_headers["If-Modified-Since"] = entry["last_modified"]
+        return conditional_headers
+
+    def get_size(self) -> int:
+        if self.size is None:
+            self.size = sum(size for _, _, size in self.list_entries())
+        return self.size
+
+    def list_entries(self) -> list[tuple[float, str, int]]:
+        entries = []
+        try:
+            with os.scandir(self.path) as files:
+                for file in files:
+                    if file.name.endswith(".json"):
+                        stat = file.stat()
+                        entries.append((stat.st_mtime, file.path, stat.st_size))
+        except OSError:
+            pass
+        return entries
+
+    def evict(self):
+        size = self.get_size()
+        for _, file_path, file_size in sorted(self.list_entries()):
+            if size <= self.max_size * EVICTION_RATIO:
+                break
+            try:
+                os.remove(file_path)
+                size -= file_size
+            except OSError:
+                pass
+        self.size = size
+
+
+def get_file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+http_cache = HttpCache(settings.http_cache_path, settings.http_cache_max_size)
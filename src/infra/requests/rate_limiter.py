@@ -0,0 +1,120 @@
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Mapping, Optional
+from urllib.parse import urlparse
+
+# Margin added when waiting for a reset, clocks of providers and hosts may differ
+RESET_MARGIN = 1.0
+
+# Github asks to wait at least one minute when throttled without further details
+DEFAULT_RETRY_DELAY = 60.0
+
+
+@dataclass
+class RateLimit:
+    remaining: Optional[int] = None
+    reset_at: Optional[float] = None
+    retry_at: float = 0
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every request of the process, one bucket per
+    (token, host).
+
+    Buckets are filled from the rate limit headers sent back by Github and Azure
+    (`X-RateLimit-Remaining`, `X-RateLimit-Reset`, `Retry-After`,
+    `X-RateLimit-Delay`). Requests run freely while some quota remains. Once it
+    is exhausted, they pause until the reset instead of failing.
+    """
+
+    def __init__(self):
+        self.limits: dict[tuple[str, str], RateLimit] = {}
+
+    @staticmethod
+    def get_key(url: str, headers: Optional[Mapping[str, str]] = None):
+        authorization = (headers or {}).get("Authorization", "")
+        token = hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+        return token, urlparse(url).netloc
+
+    def get_delay(self, key) -> float:
+        rate_limit = self.limits.get(key)
+        if rate_limit is None:
+            return 0
+
+        now = time.time()
+        if rate_limit.retry_at > now:
+            return rate_limit.retry_at - now
+
+        if rate_limit.remaining is not None and rate_limit.remaining <= 0:
+            if rate_limit.reset_at is None or rate_limit.reset_at <= now:
+                # Quota has been reset: next response will tell the new one
+                rate_limit.remaining = None
+                return 0
+            return rate_limit.reset_at - now
+
+        return 0
+
+    async def acquire(self, url: str, headers: Optional[Mapping[str, str]] = None):
+        key = self.get_key(url, headers)
+        delay = self.get_delay(key)
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self.get_delay(key)
+
+        rate_limit = self.limits.get(key)
+        if rate_limit is not None and rate_limit.remaining is not None:
+            # Reserve a token until the response gives the actual remaining quota
+            rate_limit.remaining -= 1
+
+    def update(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        status: int,
+        response_headers: Mapping[str, str],
+    ):
+        key = self.get_key(url, headers)
+        rate_limit = self.limits.setdefault(key, RateLimit())
+
+        remaining = parse_number(response_headers.get("X-RateLimit-Remaining"))
+        reset_at = parse_number(response_headers.get("X-RateLimit-Reset"))
+        if remaining is not None:
+            rate_limit.remaining = int(remaining)
+        if reset_at is not None:
+            rate_limit.reset_at = reset_at + RESET_MARGIN
+
+        retry_after = parse_number(
+            response_headers.get("Retry-After")
+            or response_headers.get("X-RateLimit-Delay")
+        )
+        if retry_after is not None:
+            rate_limit.retry_at = time.time() + retry_after
+        elif self.is_rate_limited(status, response_headers):
+            if rate_limit.reset_at is not None and rate_limit.reset_at > time.time():
+                rate_limit.remaining = 0
+            else:
+                rate_limit.retry_at = time.time() + DEFAULT_RETRY_DELAY
+
+    @staticmethod
+    def is_rate_limited(status: int, response_headers: Mapping[str, str]) -> bool:
+        if status == 429:
+            return True
+
+        # Github answers 403 both for forbidden resources and exhausted quotas
+        return status == 403 and (
+            response_headers.get("X-RateLimit-Remaining") == "0"
+            or "Retry-After" in response_headers
+        )
+
+
+def parse_number(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+CONNECTOR_OPTIONS = {
+    "limit": 200,
+    "limit_per_host": 100,
+    "ttl_dns_cache": 300,
+    "keepalive_timeout": 60,
+}
+
+
+class SessionManager:
+    """
+    Shares one aiohttp.ClientSession, and therefore one pool of keep-alive
+    connections, between all the requests of an event loop.
+
+    Headers and timeouts are given per request, so that the same connections are
+    reused whatever the repository or the token.
+    """
+
+    def __init__(self, connector_options: Optional[dict] = None):
+        self.connector_options = {**CONNECTOR_OPTIONS, **(connector_options or {})}
+        self.sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+    def get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+
+        # Sessions of closed loops cannot be used, nor closed, anymore
+        for other_loop in [other for other in self.sessions if other.is_closed()]:
+            del self.sessions[other_loop]
+
+        session = self.sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self.connector_options),
+            )
+            self.sessions[loop] = session
+
+        return session
+
+    async def close(self):
+        session = self.sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+
+session_manager = SessionManager()
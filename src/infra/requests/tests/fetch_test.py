@@ -0,0 +1,36 @@
+import time
+
+from src.infra.requests.fetch import async_fetch
+from src.infra.requests.http_cache import HttpCache
+
+URL = "https://api.github.com/repos/orga/myrepo/pulls"
+
+
+async def test_fetches_json(mocker_aio):
+    mocker_aio.get(URL, payload=[{"number": 1}])
+
+    assert await async_fetch(URL) == [{"number": 1}]
+
+
+async def test_waits_and_retries_when_rate_limited(mocker_aio):
+    mocker_aio.get(URL, status=429, headers={"Retry-After": "0.3"})
+    mocker_aio.get(URL, payload=[{"number": 1}])
+
+    start = time.time()
+    assert await async_fetch(URL, max_retries=1) == [{"number": 1}]
+    assert time.time() - start >= 0.25
+
+
+async def test_serves_not_modified_responses_from_cache(mocker, mocker_aio, tmp_path):
+    mocker.patch(
+        "src.infra.requests.fetch.http_cache",
+        HttpCache(str(tmp_path), max_size=10000),
+    )
+    mocker_aio.get(URL, payload=[{"number": 1}], headers={"ETag": '"abc"'})
+    mocker_aio.get(URL, status=304)
+
+    assert await async_fetch(URL) == [{"number": 1}]
+    assert await async_fetch(URL) == [{"number": 1}]
+
+    second_request = list(mocker_aio.requests.values())[0][1]
+    assert second_request.kwargs["headers"]["If-None-Match"] == '"abc"'
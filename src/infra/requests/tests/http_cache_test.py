@@ -0,0 +1,50 @@
+import os
+
+from src.infra.requests.http_cache import HttpCache
+
+URL = "https://api.github.com/repos/orga/myrepo/pulls?page=1"
+HEADERS = {"Authorization": "token my_token"}
+
+
+def test_stores_responses_with_validators(tmp_path):
+    cache = HttpCache(str(tmp_path), max_size=10000)
+
+    cache.set(URL, HEADERS, {"ETag": '"abc"'}, [{"number": 1}])
+
+    entry = cache.get(URL, HEADERS)
+    assert entry["body"] == [{"number": 1}]
+    assert cache.get_conditional_headers(entry) == {"If-None-Match": '"abc"'}
+
+    # Responses are not shared between tokens
+    assert cache.get(URL, {"Authorization": "token other_token"}) is None
+
+
+def test_does_not_store_responses_without_validators(tmp_path):
+    cache = HttpCache(str(tmp_path), max_size=10000)
+
+    cache.set(URL, HEADERS, {}, [{"number": 1}])
+
+    assert cache.get(URL, HEADERS) is None
+
+
+def test_is_disabled_without_path():
+    cache = HttpCache("", max_size=10000)
+
+    cache.set(URL, HEADERS, {"ETag": '"abc"'}, [{"number": 1}])
+
+    assert cache.get(URL, HEADERS) is None
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    cache = HttpCache(str(tmp_path), max_size=600)
+    body = ["x" * 50]
+
+    for page in range(3):
+        cache.set(f"{URL}{page}", HEADERS, {"ETag": '"abc"'}, body)
+        os.utime(cache.get_file_path(f"{URL}{page}", HEADERS), (page, page))
+
+    cache.set(f"{URL}3", HEADERS, {"ETag": '"abc"'}, body)
+
+    assert cache.get(f"{URL}0", HEADERS) is None
+    assert cache.get(f"{URL}3", HEADERS) is not None
+    assert cache.get_size() <= 600
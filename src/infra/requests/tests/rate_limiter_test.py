@@ -0,0 +1,66 @@
+import time
+
+import pytest
+
+from src.infra.requests.rate_limiter import RateLimiter
+
+URL = "https://api.github.com/repos/orga/myrepo/pulls"
+HEADERS = {"Authorization": "Bearer token"}
+
+
+@pytest.fixture
+def rate_limiter():
+    return RateLimiter()
+
+
+async def test_does_not_wait_while_quota_remains(rate_limiter):
+    rate_limiter.update(
+        URL,
+        HEADERS,
+        200,
+        {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(time.time() + 3600)},
+    )
+
+    start = time.time()
+    await rate_limiter.acquire(URL, HEADERS)
+    await rate_limiter.acquire(URL, HEADERS)
+    assert time.time() - start < 0.1
+
+
+async def test_waits_for_reset_when_quota_is_exhausted(rate_limiter, mocker):
+    mocker.patch("src.infra.requests.rate_limiter.RESET_MARGIN", 0)
+    rate_limiter.update(
+        URL,
+        HEADERS,
+        200,
+        {"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": str(time.time() + 0.3)},
+    )
+
+    start = time.time()
+    await rate_limiter.acquire(URL, HEADERS)
+    await rate_limiter.acquire(URL, HEADERS)
+    assert time.time() - start >= 0.25
+
+
+async def test_honors_retry_after(rate_limiter):
+    rate_limiter.update(URL, HEADERS, 429, {"Retry-After": "0.3"})
+
+    start = time.time()
+    await rate_limiter.acquire(URL, HEADERS)
+    assert time.time() - start >= 0.25
+
+
+async def test_buckets_are_per_token_and_host(rate_limiter):
+    rate_limiter.update(URL, HEADERS, 429, {"Retry-After": "10"})
+
+    start = time.time()
+    await rate_limiter.acquire(URL, {"Authorization": "Bearer another_token"})
+    await rate_limiter.acquire("https://dev.azure.com/orga/project", HEADERS)
+    assert time.time() - start < 0.1
+
+
+def test_detects_rate_limited_responses():
+    assert RateLimiter.is_rate_limited(429, {})
+    assert RateLimiter.is_rate_limited(403, {"X-RateLimit-Remaining": "0"})
+    assert not RateLimiter.is_rate_limited(403, {"X-RateLimit-Remaining": "10"})
+    assert not RateLimiter.is_rate_limited(200, {"X-RateLimit-Remaining": "0"})
@@ -0,0 +1,33 @@
+from src.infra.requests.session import SessionManager
+
+
+async def test_reuses_the_same_session():
+    session_manager = SessionManager()
+
+    session = session_manager.get_session()
+    assert session_manager.get_session() is session
+
+    await session_manager.close()
+
+
+async def test_closes_the_session():
+    session_manager = SessionManager()
+
+    session = session_manager.get_session()
+    await session_manager.close()
+
+    assert session.closed
+    assert session_manager.get_session() is not session
+
+    await session_manager.close()
+
+
+async def test_configures_the_connection_pool():
+    session_manager = SessionManager({"limit_per_host": 5})
+
+    connector = session_manager.get_session().connector
+    assert connector is not None
+    assert connector.limit_per_host == 5
+    assert connector.limit == 200
+
+    await session_manager.close()
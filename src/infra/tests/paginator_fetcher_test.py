@@ -0,0 +1,84 @@
+import asyncio
+
+from src.infra.paginator_fetcher import PaginatorWorker
+
+
+class NumbersPaginatorWorker(PaginatorWorker):
+    """Pages of `items_per_page` numbers, up to `total` numbers."""
+
+    def __init__(self, total, page_count=None, *args, **kwargs):
+        self.total = total
+        self.page_count = page_count
+        self.requested_pages: list[int] = []
+        self.cancelled_pages: list[int] = []
+        super().__init__(*args, **kwargs)
+
+    async def get_url(self, page):
+        return str(page)
+
+    def get_page_count(self, headers):
+        return headers.get("page_count")
+
+    async def request(self, url):
+        page = int(url)
+        self.requested_pages.append(page)
+        try:
+            # Pages after the end are slower, they are cancelled before answering
+            await asyncio.sleep(0.01 if page * self.items_per_page < self.total else 1)
+        except asyncio.CancelledError:
+            self.cancelled_pages.append(page)
+            raise
+
+        start = page * self.items_per_page
+        data = list(range(start, min(start + self.items_per_page, self.total)))
+        return data, {"page_count": self.page_count}
+
+    async def process_data(self, data, options=None):
+        return data, len(data) == self.items_per_page
+
+
+async def fetch_all(worker):
+    rows: list[int] = []
+    async for data in await worker.fetch():
+        rows = rows + data
+    return sorted(rows)
+
+
+async def test_fans_out_the_pages_given_by_the_first_response(mock_logger):
+    worker = NumbersPaginatorWorker(
+        total=50,
+        page_count=5,
+        items_per_page=10,
+        max_concurrency=10,
+        logger=mock_logger,
+        fan_out=True,
+    )
+
+    assert await fetch_all(worker) == list(range(50))
+    assert sorted(worker.requested_pages) == [0, 1, 2, 3, 4]
+
+
+async def test_cancels_requests_after_the_last_page(mock_logger):
+    worker = NumbersPaginatorWorker(
+        total=25,
+        items_per_page=10,
+        max_concurrency=5,
+        logger=mock_logger,
+        fan_out=True,
+    )
+
+    assert await fetch_all(worker) == list(range(25))
+    assert sorted(worker.cancelled_pages) == [3, 4, 5]
+
+
+async def test_stops_after_a_short_first_page(mock_logger):
+    worker = NumbersPaginatorWorker(
+        total=5,
+        items_per_page=10,
+        max_concurrency=5,
+        logger=mock_logger,
+        fan_out=True,
+    )
+
+    assert await fetch_all(worker) == list(range(5))
+    assert worker.requested_pages == [0]